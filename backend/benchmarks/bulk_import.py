@@ -0,0 +1,45 @@
+"""Measure bulk import throughput through POST /api/v1/restaurants/bulk.
+
+Usage: uv run python -m benchmarks.bulk_import [total_rows]
+"""
+import sys
+import time
+
+from benchmarks.common import api_client, seed_tags, seeded_user
+
+BATCH_SIZE = 5000
+TARGET_ROWS_PER_SECOND = 10_000
+
+
+def main(total: int = 50_000) -> int:
+    tag_ids = [str(t) for t in seed_tags(5)]
+    with seeded_user() as (_, api_key):
+        with api_client(api_key) as client:
+            imported = 0
+            started = time.perf_counter()
+            while imported < total:
+                items = [
+                    {
+                        "name": f"Imported {imported + i}",
+                        "country": "Italy",
+                        "city": "Rome",
+                        "price_range": i % 4 + 1,
+                        "tag_ids": tag_ids[: i % 3],
+                    }
+                    for i in range(min(BATCH_SIZE, total - imported))
+                ]
+                response = client.post("/api/v1/restaurants/bulk", json={"items": items})
+                response.raise_for_status()
+                imported += response.json()["created"]
+            elapsed = time.perf_counter() - started
+
+    rate = imported / elapsed
+    print(f"imported {imported} rows in {elapsed:.2f}s ({rate:,.0f} rows/s)")
+    if rate < TARGET_ROWS_PER_SECOND:
+        print(f"FAIL: below the {TARGET_ROWS_PER_SECOND:,} rows/s target", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:])))
@@ -0,0 +1,122 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run against the database in DATABASE_URL, which must be a
+disposable Postgres instance migrated to head (``alembic upgrade head``).
+Every run seeds its own user and removes it again afterwards.
+"""
+import secrets
+import uuid
+from contextlib import contextmanager
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.database import SessionLocal, async_engine, engine
+from src.core.security import generate_api_key
+from src.main import app
+from src.models.password_reset_token import PasswordResetToken
+from src.models.restaurant import Restaurant
+from src.models.review import Review
+from src.models.tag import Tag, RestaurantTag
+from src.models.user import User
+from src.repositories.user_stat import UserStatRepository
+
+
+# The engine that serves API requests in the configured DATABASE_MODE
+request_engine = async_engine.sync_engine if async_engine is not None else engine
+
+
+class StatementCounter:
+    """Counts SQL statements and commits sent through an engine while active."""
+
+    def __init__(self, bind: Engine = request_engine):
+        self.bind = bind
+        self.count = 0
+        self.commits = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def _on_commit(self, conn):
+        self.commits += 1
+
+    def __enter__(self) -> "StatementCounter":
+        self.count = 0
+        self.commits = 0
+        event.listen(self.bind, "before_cursor_execute", self._on_execute)
+        event.listen(self.bind, "commit", self._on_commit)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(self.bind, "before_cursor_execute", self._on_execute)
+        event.remove(self.bind, "commit", self._on_commit)
+
+
+@contextmanager
+def seeded_user():
+    """Create a throwaway user and yield ``(user_id, api_key)``."""
+    suffix = secrets.token_hex(6)
+    api_key = generate_api_key()
+    with SessionLocal() as db:
+        user = User(
+            email=f"bench-{suffix}@example.com",
+            username=f"bench-{suffix}",
+            password_hash="!",
+            api_key=api_key,
+        )
+        db.add(user)
+        db.commit()
+        user_id = user.id
+    try:
+        yield user_id, api_key
+    finally:
+        delete_user(user_id)
+
+
+def seed_tags(count: int) -> list[uuid.UUID]:
+    """Return ``count`` tag IDs, creating benchmark tags if needed."""
+    with SessionLocal() as db:
+        tags = db.query(Tag).filter(Tag.category == "bench").order_by(Tag.name).limit(count).all()
+        for i in range(len(tags), count):
+            tag = Tag(name=f"bench-{i:04d}", category="bench")
+            db.add(tag)
+            tags.append(tag)
+        db.commit()
+        return [t.id for t in tags]
+
+
+def seed_restaurants(user_id: uuid.UUID, count: int, tag_ids: list[uuid.UUID]) -> None:
+    with SessionLocal() as db:
+        for i in range(count):
+            restaurant = Restaurant(
+                user_id=user_id,
+                name=f"Bench Restaurant {i}",
+                country="Japan",
+                city="Tokyo",
+                price_range=i % 4 + 1,
+            )
+            db.add(restaurant)
+            db.flush()
+            for tag_id in tag_ids[: i % (len(tag_ids) + 1)]:
+                db.add(RestaurantTag(restaurant_id=restaurant.id, tag_id=tag_id))
+        # Seeding skips the services, so count the rows afterwards
+        UserStatRepository(db).rebuild([user_id])
+        db.commit()
+
+
+def delete_user(user_id: uuid.UUID) -> None:
+    with SessionLocal() as db:
+        restaurant_ids = db.query(Restaurant.id).filter(Restaurant.user_id == user_id)
+        db.query(RestaurantTag).filter(RestaurantTag.restaurant_id.in_(restaurant_ids)).delete()
+        db.query(Review).filter(Review.restaurant_id.in_(restaurant_ids)).delete()
+        db.query(Restaurant).filter(Restaurant.user_id == user_id).delete()
+        db.query(PasswordResetToken).filter(PasswordResetToken.user_id == user_id).delete()
+        db.query(User).filter(User.id == user_id).delete()
+        db.commit()
+
+
+def api_client(api_key: str) -> TestClient:
+    """Return an authenticated client; use it as a context manager so every
+    request shares one event loop (async mode pools connections per loop)."""
+    return TestClient(app, headers={"Authorization": f"Bearer {api_key}"})
@@ -0,0 +1,426 @@
+"""Drive every API router with concurrent clients and report per-route cost.
+
+Seeds users with ``benchmarks.seed``, then runs a fixed, seeded mix of
+requests through the ASGI app: restaurant reads and writes, reviews,
+tags, stats, auth and Places. Google Places is replaced by a local
+stand-in (``httpx.MockTransport``) that answers after ``--places-latency``
+ms. Each worker replays the same sequence for the same ``--seed``, so
+runs are comparable.
+
+Prints p50/p95/p99 latency, throughput and SQL statements per request for
+every route. ``--save`` writes the results as JSON and ``--baseline``
+compares against such a file, failing on a p95 slowdown beyond
+``--tolerance`` or on more statements per request.
+
+Usage: uv run python -m benchmarks.load [--users 10] [--restaurants 1000]
+    [--concurrency 16] [--requests 5000] [--save FILE] [--baseline FILE]
+"""
+import argparse
+import asyncio
+import io
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+
+import httpx
+from PIL import Image
+
+from benchmarks.common import seed_tags
+from benchmarks.seed import PASSWORD, SeededUser, seed, unseed
+from src.api.v1.routers import places as places_router
+from src.core.config import settings
+from src.core.http import create_places_client
+from src.main import app
+from src.services.photos import PhotoStore
+
+PLACE_PREFIX = "load-place-"
+PLACE_IDS = [f"{PLACE_PREFIX}{i}" for i in range(50)]
+SEARCHES = ["sushi", "ramen", "pizza", "tacos", "noodles", "bakery", "coffee", "curry"]
+WARMUP_REQUESTS = 50
+
+
+class CountStatements:
+    """ASGI wrapper that collects each request's SQL statement count.
+
+    Reads the app's own ``RequestTiming`` once the app is done with the
+    request, so statements issued while streaming a body count too. The
+    count lands in ``counts`` under the request's ``x-load-id`` header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.counts: dict[str, int] = {}
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_id = dict(scope.get("headers", [])).get(b"x-load-id")
+            timing = scope.get("state", {}).get("timing")
+            if request_id and timing:
+                self.counts[request_id.decode()] = timing.statements
+
+
+def places_stand_in(latency: float) -> httpx.MockTransport:
+    """A local stand-in for the Google Places endpoints the app calls."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (1600, 1067), (200, 120, 60)).save(buffer, "JPEG")
+    photo = buffer.getvalue()
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        path = request.url.path
+        if path.endswith("/autocomplete/json"):
+            q = request.url.params["input"]
+            return httpx.Response(200, json={"status": "OK", "predictions": [
+                {
+                    "place_id": f"{PLACE_PREFIX}{i}",
+                    "description": f"{q.title()} {i}, Tokyo, Japan",
+                    "structured_formatting": {"main_text": f"{q.title()} {i}", "secondary_text": "Tokyo, Japan"},
+                }
+                for i in range(5)
+            ]})
+        if path.endswith("/details/json"):
+            place_id = request.url.params["place_id"]
+            return httpx.Response(200, json={"status": "OK", "result": {
+                "name": f"Place {place_id}",
+                "website": "https://example.com",
+                "url": f"https://maps.example.com/{place_id}",
+                "price_level": 2,
+                "address_components": [
+                    {"long_name": "Japan", "types": ["country"]},
+                    {"long_name": "Tokyo", "types": ["locality"]},
+                    {"long_name": "Shibuya", "types": ["sublocality_level_1"]},
+                ],
+                "photos": [{"photo_reference": f"ref-{place_id}"}],
+            }})
+        if path.endswith("/photo"):
+            return httpx.Response(200, content=photo, headers={"content-type": "image/jpeg"})
+        return httpx.Response(404)
+
+    return httpx.MockTransport(handle)
+
+
+class Worker:
+    """One simulated client; its request sequence depends only on the seed."""
+
+    def __init__(self, index: int, user: SeededUser, tag_ids: list[str], seed: int):
+        self.rng = random.Random(seed * 1000 + index)
+        self.user = user
+        self.tag_ids = tag_ids
+        self.headers = {"Authorization": f"Bearer {user.api_key}"}
+        # Restaurants this worker created, the only ones it deletes
+        self.created: list[str] = []
+        # Places this worker has seen details of; the photo proxy only
+        # serves photos the API handed out
+        self.places: list[str] = []
+        self.scenarios = [
+            (20, self.list_restaurants),
+            (5, self.filter_restaurants),
+            (5, self.search_restaurants),
+            (10, self.get_restaurant),
+            (3, self.create_restaurant),
+            (3, self.update_restaurant),
+            (3, self.toggle_favorite),
+            (2, self.delete_restaurant),
+            (1, self.bulk_create),
+            (1, self.batch),
+            (1, self.bulk_delete),
+            (1, self.export),
+            (2, self.mark_tried),
+            (1, self.mark_saved),
+            (5, self.list_tags),
+            (2, self.config_options),
+            (5, self.stats),
+            (3, self.me),
+            (1, self.login),
+            (1, self.forgot_password),
+            (3, self.places_search),
+            (2, self.place_details),
+            (1, self.place_photo),
+        ]
+
+    def next_request(self) -> tuple[str, str, str, dict]:
+        """Pick the next request as ``(route, method, url, kwargs)``."""
+        weights = [weight for weight, _ in self.scenarios]
+        scenario = self.rng.choices([s for _, s in self.scenarios], weights)[0]
+        return scenario()
+
+    def seeded_id(self) -> str:
+        return str(self.rng.choice(self.user.restaurant_ids))
+
+    def record(self, route: str, response: httpx.Response) -> None:
+        if route in ("POST /restaurants", "POST /restaurants/bulk") and response.status_code < 300:
+            body = response.json()
+            results = body["results"] if "results" in body else [body]
+            self.created.extend(str(result["id"]) for result in results if result.get("id"))
+        if route == "GET /places/details/{id}" and response.status_code == 200:
+            place_id = response.json()["place_id"]
+            if place_id not in self.places:
+                self.places.append(place_id)
+
+    def list_restaurants(self):
+        return "GET /restaurants", "GET", "/api/v1/restaurants", {"params": {"limit": 50}}
+
+    def filter_restaurants(self):
+        params = {"limit": 50, "status": self.rng.choice(["saved", "tried"]), "is_favorite": "true"}
+        return "GET /restaurants?filters", "GET", "/api/v1/restaurants", {"params": params}
+
+    def search_restaurants(self):
+        q = self.rng.choice(["ramen", "golden", "bistro", "tokyo", "smoky grill", "trattria"])
+        return "GET /restaurants?q", "GET", "/api/v1/restaurants", {"params": {"q": q, "limit": 20}}
+
+    def get_restaurant(self):
+        return "GET /restaurants/{id}", "GET", f"/api/v1/restaurants/{self.seeded_id()}", {}
+
+    def create_restaurant(self):
+        body = {
+            "name": f"Load {self.rng.randrange(10_000)}",
+            "country": "Japan",
+            "city": self.rng.choice(["Tokyo", "Osaka"]),
+            "price_range": self.rng.randint(1, 4),
+            "tag_ids": self.rng.sample(self.tag_ids, 2),
+        }
+        return "POST /restaurants", "POST", "/api/v1/restaurants", {"json": body}
+
+    def update_restaurant(self):
+        body = {"notes": f"visited {self.rng.randrange(100)} times", "price_range": self.rng.randint(1, 4)}
+        return "PATCH /restaurants/{id}", "PATCH", f"/api/v1/restaurants/{self.seeded_id()}", {"json": body}
+
+    def toggle_favorite(self):
+        url = f"/api/v1/restaurants/{self.seeded_id()}/toggle-favorite"
+        return "POST /restaurants/{id}/toggle-favorite", "POST", url, {}
+
+    def delete_restaurant(self):
+        if not self.created:
+            return self.create_restaurant()
+        url = f"/api/v1/restaurants/{self.created.pop()}"
+        return "DELETE /restaurants/{id}", "DELETE", url, {}
+
+    def bulk_create(self):
+        items = [
+            {"name": f"Bulk {i}", "country": "Italy", "city": "Rome", "tag_ids": self.tag_ids[: i % 3]}
+            for i in range(50)
+        ]
+        return "POST /restaurants/bulk", "POST", "/api/v1/restaurants/bulk", {"json": {"items": items}}
+
+    def batch(self):
+        ids = [self.seeded_id() for _ in range(20)]
+        operations = [
+            {"op": "set_favorite", "ids": ids, "is_favorite": self.rng.random() < 0.5},
+            {"op": "add_tags", "ids": ids, "tag_ids": self.rng.sample(self.tag_ids, 1)},
+        ]
+        return "POST /restaurants/batch", "POST", "/api/v1/restaurants/batch", {"json": {"operations": operations}}
+
+    def bulk_delete(self):
+        if not self.created:
+            return self.bulk_create()
+        ids, self.created = self.created[-50:], self.created[:-50]
+        return "POST /restaurants/bulk-delete", "POST", "/api/v1/restaurants/bulk-delete", {"json": {"ids": ids}}
+
+    def export(self):
+        return "GET /restaurants/export", "GET", "/api/v1/restaurants/export", {}
+
+    def mark_tried(self):
+        url = f"/api/v1/restaurants/{self.seeded_id()}/mark-tried"
+        return "POST /restaurants/{id}/mark-tried", "POST", url, {"json": {"rating": self.rng.randint(1, 5)}}
+
+    def mark_saved(self):
+        return "POST /restaurants/{id}/mark-saved", "POST", f"/api/v1/restaurants/{self.seeded_id()}/mark-saved", {}
+
+    def list_tags(self):
+        return "GET /tags", "GET", "/api/v1/tags", {}
+
+    def config_options(self):
+        return "GET /config/options", "GET", "/api/v1/config/options", {}
+
+    def stats(self):
+        return "GET /stats", "GET", "/api/v1/stats", {}
+
+    def me(self):
+        return "GET /auth/me", "GET", "/api/v1/auth/me", {}
+
+    def login(self):
+        body = {"email": self.user.email, "password": PASSWORD}
+        return "POST /auth/login", "POST", "/api/v1/auth/login", {"json": body}
+
+    def forgot_password(self):
+        return "POST /auth/forgot-password", "POST", "/api/v1/auth/forgot-password", {"json": {"email": self.user.email}}
+
+    def places_search(self):
+        q = self.rng.choice(SEARCHES)[: self.rng.randint(2, 5)]
+        return "GET /places/search", "GET", "/api/v1/places/search", {"params": {"q": q}}
+
+    def place_details(self):
+        return "GET /places/details/{id}", "GET", f"/api/v1/places/details/{self.rng.choice(PLACE_IDS)}", {}
+
+    def place_photo(self):
+        if not self.places:
+            return self.place_details()
+        url = f"/api/v1/places/photo/ref-{self.rng.choice(self.places)}"
+        return "GET /places/photo/{ref}", "GET", url, {"params": {"w": self.rng.choice([200, 400, 800])}}
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[max(0, int(len(values) * p) - 1)]
+
+
+async def run(users: list[SeededUser], tag_ids: list[str], args) -> tuple[dict, float]:
+    counter = CountStatements(app)
+    samples: dict[str, list[tuple[float, int, int]]] = defaultdict(list)
+    workers = [Worker(i, users[i % len(users)], tag_ids, args.seed) for i in range(args.concurrency)]
+    budget = {"left": args.requests}
+
+    async def drive(client: httpx.AsyncClient, worker: Worker, record: bool) -> None:
+        while budget["left"] > 0:
+            budget["left"] -= 1
+            route, method, url, kwargs = worker.next_request()
+            request_id = uuid.uuid4().hex
+            headers = {**worker.headers, "x-load-id": request_id}
+            started = time.perf_counter()
+            response = await client.request(method, url, headers=headers, **kwargs)
+            elapsed = time.perf_counter() - started
+            worker.record(route, response)
+            if record:
+                samples[route].append((elapsed, counter.counts.pop(request_id, 0), response.status_code))
+            else:
+                counter.counts.pop(request_id, None)
+
+    transport = httpx.ASGITransport(app=counter)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load") as client:
+        async with app.router.lifespan_context(app):
+            real_places_client = app.state.places_client
+            app.state.places_client = create_places_client(places_stand_in(args.places_latency / 1000))
+            try:
+                budget["left"] = WARMUP_REQUESTS
+                await asyncio.gather(*(drive(client, worker, False) for worker in workers))
+                budget["left"] = args.requests
+                started = time.perf_counter()
+                await asyncio.gather(*(drive(client, worker, True) for worker in workers))
+                elapsed = time.perf_counter() - started
+            finally:
+                await app.state.places_client.aclose()
+                app.state.places_client = real_places_client
+    return samples, elapsed
+
+
+def summarize(samples: dict[str, list[tuple[float, int, int]]], elapsed: float) -> dict:
+    routes = {}
+    for route, rows in sorted(samples.items()):
+        latencies = [latency for latency, _, _ in rows]
+        routes[route] = {
+            "requests": len(rows),
+            "rps": len(rows) / elapsed,
+            "p50_ms": percentile(latencies, 0.50) * 1000,
+            "p95_ms": percentile(latencies, 0.95) * 1000,
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+            "statements": statistics.mean(statements for _, statements, _ in rows),
+            "errors": sum(1 for _, _, status in rows if status >= 400),
+        }
+    total = sum(route["requests"] for route in routes.values())
+    return {
+        "mode": settings.database_mode,
+        "requests": total,
+        "seconds": elapsed,
+        "rps": total / elapsed,
+        "routes": routes,
+    }
+
+
+def print_report(report: dict, baseline: dict | None) -> None:
+    print(
+        f"mode={report['mode']} requests={report['requests']} "
+        f"elapsed={report['seconds']:.1f}s throughput={report['rps']:,.0f} req/s"
+    )
+    print(f"{'route':<42} {'n':>5} {'req/s':>7} {'p50':>7} {'p95':>7} {'p99':>7} {'stmts':>6} {'err':>4}")
+    for route, stats in report["routes"].items():
+        line = (
+            f"{route:<42} {stats['requests']:>5} {stats['rps']:>7.1f} {stats['p50_ms']:>7.1f} "
+            f"{stats['p95_ms']:>7.1f} {stats['p99_ms']:>7.1f} {stats['statements']:>6.1f} {stats['errors']:>4}"
+        )
+        previous = (baseline or {}).get("routes", {}).get(route)
+        if previous:
+            line += (
+                f"   p95 {stats['p95_ms'] - previous['p95_ms']:+.1f}ms"
+                f" stmts {stats['statements'] - previous['statements']:+.1f}"
+            )
+        print(line)
+
+
+def regressions(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Routes whose p95 grew beyond ``tolerance`` or that issue more statements."""
+    found = []
+    for route, stats in report["routes"].items():
+        previous = baseline["routes"].get(route)
+        if not previous:
+            continue
+        # Ignore sub-millisecond jitter on very fast routes
+        if stats["p95_ms"] > previous["p95_ms"] * (1 + tolerance) + 1:
+            found.append(f"{route}: p95 {previous['p95_ms']:.1f}ms -> {stats['p95_ms']:.1f}ms")
+        # Averages shift a little with cache hits and which rows were picked
+        if stats["statements"] > previous["statements"] + 0.5:
+            found.append(f"{route}: statements {previous['statements']:.1f} -> {stats['statements']:.1f}")
+    return found
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks.load", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--restaurants", type=int, default=1000, help="per user")
+    parser.add_argument("--tags", type=int, default=20)
+    parser.add_argument("--tried", type=float, default=0.4, help="share of restaurants with a review")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--places-latency", type=float, default=30, help="stand-in Places latency in ms")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results saved with --save")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p95 slowdown, 0.25 = 25%%")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["mode"] != settings.database_mode:
+            print(f"warning: baseline was recorded with DATABASE_MODE={baseline['mode']}", file=sys.stderr)
+
+    # Keep email delivery out of the measurements
+    settings.email_outbox_sender_enabled = False
+    settings.google_places_api_key = settings.google_places_api_key or "offline"
+    started = time.perf_counter()
+    users = seed(args.users, args.restaurants, args.tags, args.tried, args.seed)
+    print(f"seeded {args.users} users x {args.restaurants} restaurants in {time.perf_counter() - started:.1f}s")
+    with tempfile.TemporaryDirectory() as photos:
+        places_router.photo_store = PhotoStore(photos)
+        try:
+            tag_ids = [str(t) for t in seed_tags(args.tags)]
+            samples, elapsed = asyncio.run(run(users, tag_ids, args))
+        finally:
+            unseed(users, PLACE_PREFIX)
+
+    report = summarize(samples, elapsed)
+    print_report(report, baseline)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"saved results to {args.save}")
+    if baseline:
+        found = regressions(report, baseline, args.tolerance)
+        if found:
+            print("FAIL: regressions against baseline", file=sys.stderr)
+            for line in found:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print("OK: no regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
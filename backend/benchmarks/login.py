@@ -0,0 +1,104 @@
+"""Measure login throughput and its effect on concurrent list requests.
+
+Runs list requests alone, then alongside a burst of logins, once with
+argon2 in the hashing process pool and once inline on the threadpool (how
+it worked before the pool), and prints list latency and login throughput
+for each.
+
+Usage: uv run python -m benchmarks.login [seconds]
+"""
+import asyncio
+import secrets
+import statistics
+import sys
+import time
+
+import httpx
+from fastapi.concurrency import run_in_threadpool
+
+from benchmarks.common import delete_user, seed_restaurants, seed_tags
+from src.core import security
+from src.core.config import settings
+from src.main import app
+
+LISTERS = 8
+LOGINS = 16
+PASSWORD = "correct horse battery staple"
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[max(0, int(len(values) * p) - 1)] if values else float("nan")
+
+
+async def scenario(client: httpx.AsyncClient, api_key: str, email: str, seconds: float, logins: int):
+    list_latencies: list[float] = []
+    login_status: dict[int, int] = {}
+    deadline = time.perf_counter() + seconds
+
+    async def lister():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await client.get(
+                "/api/v1/restaurants",
+                params={"limit": 50},
+                headers={"Authorization": f"Bearer {api_key}"},
+            )
+            response.raise_for_status()
+            list_latencies.append(time.perf_counter() - started)
+
+    async def login():
+        while time.perf_counter() < deadline:
+            response = await client.post(
+                "/api/v1/auth/login", json={"email": email, "password": PASSWORD}
+            )
+            login_status[response.status_code] = login_status.get(response.status_code, 0) + 1
+            if response.status_code == 503:
+                await asyncio.sleep(float(response.headers.get("retry-after", 1)))
+
+    await asyncio.gather(*(lister() for _ in range(LISTERS)), *(login() for _ in range(logins)))
+    return list_latencies, login_status
+
+
+async def run(seconds: float) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async with app.router.lifespan_context(app):
+            suffix = secrets.token_hex(6)
+            email = f"bench-login-{suffix}@example.com"
+            response = await client.post(
+                "/api/v1/auth/register",
+                json={"email": email, "username": f"bench-login-{suffix}", "password": PASSWORD},
+            )
+            response.raise_for_status()
+            body = response.json()
+            user_id, api_key = body["user"]["id"], body["api_key"]
+            hashing = security._run_hashing
+            try:
+                seed_restaurants(user_id, 200, seed_tags(5))
+                for mode in ("pool", "inline"):
+                    if mode == "inline":
+                        security._run_hashing = run_in_threadpool
+                    for logins in (0, LOGINS):
+                        latencies, statuses = await scenario(client, api_key, email, seconds, logins)
+                        ok = statuses.get(200, 0)
+                        print(
+                            f"hashing={mode:<6} logins={logins:<3} "
+                            f"list p50={statistics.median(latencies) * 1000:6.1f}ms "
+                            f"p95={percentile(latencies, 0.95) * 1000:6.1f}ms "
+                            f"list={len(latencies) / seconds:6.1f}/s "
+                            f"login ok={ok / seconds:5.1f}/s rejected={statuses.get(503, 0)}"
+                        )
+            finally:
+                security._run_hashing = hashing
+                delete_user(user_id)
+
+
+def main(seconds: float = 10.0) -> int:
+    print(f"argon2 time_cost={settings.argon2_time_cost} memory_cost={settings.argon2_memory_cost}KiB")
+    asyncio.run(run(seconds))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(float(arg) for arg in sys.argv[1:2])))
@@ -0,0 +1,121 @@
+"""Measure Google Places autocomplete latency and upstream call volume.
+
+Compares a client per call with the shared, pooled client (cache cleared
+between calls), then has many users type the same queries at once to show
+how the search cache and single-flight coalescing cut upstream calls.
+
+Runs offline against a local stub of the Places API, so it measures client
+construction and TCP connect cost but not the TLS handshake or the real
+round trip to Google, which the shared client also saves.
+
+Usage: uv run python -m benchmarks.places_client [calls]
+"""
+import asyncio
+import statistics
+import sys
+import threading
+import time
+
+import uvicorn
+from fastapi import FastAPI
+
+from src.core.config import settings
+from src.core.http import create_places_client
+from src.services.places import PlacesService, search_cache
+
+TYPISTS = 50
+TYPED = ["sushi", "sushi tokyo", "ramen", "ramen shibuya"]
+
+AUTOCOMPLETE = {
+    "status": "OK",
+    "predictions": [
+        {
+            "place_id": f"stub-{i}",
+            "description": f"Stub Place {i}, Tokyo, Japan",
+            "structured_formatting": {"main_text": f"Stub Place {i}", "secondary_text": "Tokyo, Japan"},
+        }
+        for i in range(5)
+    ],
+}
+
+stub = FastAPI()
+upstream_calls = 0
+
+
+@stub.get("/autocomplete/json")
+async def autocomplete():
+    global upstream_calls
+    upstream_calls += 1
+    # Roughly the round trip to Google, so identical lookups overlap
+    await asyncio.sleep(0.03)
+    return AUTOCOMPLETE
+
+
+def start_stub_server() -> tuple[uvicorn.Server, str]:
+    server = uvicorn.Server(uvicorn.Config(stub, host="127.0.0.1", port=0, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}"
+
+
+async def timed(search, queries: list[str], cold: bool = False) -> list[float]:
+    latencies = []
+    for q in queries:
+        if cold:
+            search_cache.clear()
+        started = time.perf_counter()
+        await search(q)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def run(calls: int) -> dict[str, list[float]]:
+    async def per_call(q: str):
+        async with create_places_client() as client:
+            await PlacesService(client).search(q)
+
+    queries = [f"sushi {i}" for i in range(calls)]
+    async with create_places_client() as shared:
+        service = PlacesService(shared)
+        results = {
+            "client per call": await timed(per_call, queries, cold=True),
+            "shared client": await timed(service.search, queries, cold=True),
+        }
+
+        # Every typist sends each prefix of each query, all at the same time
+        search_cache.clear()
+        before = upstream_calls
+        prefixes = [query[:n] for query in TYPED for n in range(2, len(query) + 1)]
+        for wave in ("typing, first wave", "typing, repeated"):
+            runs = await asyncio.gather(*(timed(service.search, prefixes) for _ in range(TYPISTS)))
+            results[wave] = [latency for run in runs for latency in run]
+        print(
+            f"typing: {2 * TYPISTS * len(prefixes)} lookups by {TYPISTS} users, "
+            f"{upstream_calls - before} upstream calls"
+        )
+        return results
+
+
+def main(calls: int = 500) -> int:
+    server, base_url = start_stub_server()
+    settings.google_places_base_url = base_url
+    settings.google_places_api_key = settings.google_places_api_key or "offline"
+    try:
+        results = asyncio.run(run(calls))
+    finally:
+        server.should_exit = True
+
+    for name, latencies in results.items():
+        latencies.sort()
+        print(
+            f"{name:<20} p50={statistics.median(latencies) * 1000:.2f}ms "
+            f"p95={latencies[int(len(latencies) * 0.95) - 1] * 1000:.2f}ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:2])))
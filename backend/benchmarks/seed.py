@@ -0,0 +1,155 @@
+"""Seed a disposable database with a reproducible dataset through COPY.
+
+The same ``seed`` value always produces the same names, places, prices,
+ratings, tags and timestamps; only IDs, emails and API keys are fresh so
+runs never collide. Rows go in with ``COPY ... FROM STDIN``, which is far
+faster than the API for building collections of realistic size.
+
+Usage: uv run python -m benchmarks.seed [users] [restaurants_per_user]
+"""
+import csv
+import io
+import random
+import secrets
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import delete_user, seed_tags
+from src.core.database import SessionLocal, engine
+from src.core.security import generate_api_key, hash_password
+from src.models.email_outbox import EmailOutbox
+from src.models.place import Place
+from src.repositories.user_stat import UserStatRepository
+
+PASSWORD = "correct horse battery staple"
+PLACES = {
+    "Japan": ["Tokyo", "Osaka", "Kyoto", "Fukuoka"],
+    "France": ["Paris", "Lyon", "Marseille"],
+    "Italy": ["Rome", "Milan", "Naples", "Bologna"],
+    "Mexico": ["Mexico City", "Oaxaca"],
+    "United States": ["New York", "San Francisco", "Chicago", "Austin"],
+    "Thailand": ["Bangkok", "Chiang Mai"],
+}
+AREAS = ["Old Town", "Harbour", "Market District", "University", None]
+ADJECTIVES = ["Golden", "Little", "Blue", "Smoky", "Hidden", "Corner", "Lucky", "Green", "Red", "Night"]
+NOUNS = ["Ramen", "Trattoria", "Bistro", "Taqueria", "Noodle Bar", "Bakery", "Grill", "Izakaya", "Cafe", "Kitchen"]
+
+
+@dataclass
+class SeededUser:
+    id: uuid.UUID
+    email: str
+    api_key: str
+    restaurant_ids: list[uuid.UUID] = field(default_factory=list)
+
+
+def _copy(cursor, table: str, columns: list[str], rows: list[tuple]) -> None:
+    buffer = io.StringIO()
+    # Unquoted empty fields (None) load as NULL in CSV format
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def seed(
+    users: int = 10,
+    restaurants: int = 1000,
+    tags: int = 20,
+    tried: float = 0.4,
+    seed: int = 1,
+) -> list[SeededUser]:
+    """Create ``users`` users with ``restaurants`` restaurants each.
+
+    A ``tried`` share of restaurants has a review, and each has up to three
+    of ``tags`` shared tags. Every user's password is ``PASSWORD``.
+    """
+    rng = random.Random(seed)
+    tag_ids = seed_tags(tags)
+    run = secrets.token_hex(4)
+    now = datetime.now(timezone.utc)
+    # One hash for everyone; argon2 is deliberately too slow to run per user
+    password_hash = hash_password(PASSWORD)
+    seeded = [
+        SeededUser(id=uuid.uuid4(), email=f"load-{run}-{i}@example.com", api_key=generate_api_key())
+        for i in range(users)
+    ]
+    user_rows, restaurant_rows, review_rows, tag_rows = [], [], [], []
+    for i, user in enumerate(seeded):
+        user_rows.append((user.id, user.email, f"load-{run}-{i}", password_hash, user.api_key))
+        for _ in range(restaurants):
+            restaurant_id = uuid.uuid4()
+            user.restaurant_ids.append(restaurant_id)
+            country = rng.choice(list(PLACES))
+            created_at = now - timedelta(seconds=rng.uniform(0, 365 * 24 * 3600))
+            is_tried = rng.random() < tried
+            restaurant_rows.append((
+                restaurant_id,
+                user.id,
+                "TRIED" if is_tried else "SAVED",
+                f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}",
+                country,
+                rng.choice(PLACES[country]),
+                rng.choice(AREAS),
+                rng.choice([1, 2, 3, 4, None]),
+                "Seeded for load tests" if rng.random() < 0.3 else None,
+                rng.random() < 0.15,
+                created_at,
+                created_at,
+            ))
+            if is_tried:
+                review_rows.append((
+                    uuid.uuid4(), restaurant_id, rng.randint(1, 5), None, created_at, created_at, created_at
+                ))
+            for tag_id in rng.sample(tag_ids, rng.randint(0, min(3, len(tag_ids)))):
+                tag_rows.append((restaurant_id, tag_id))
+
+    connection = engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            _copy(cursor, "users", ["id", "email", "username", "password_hash", "api_key"], user_rows)
+            _copy(cursor, "restaurants", [
+                "id", "user_id", "status", "name", "country", "city", "area", "price_range",
+                "notes", "is_favorite", "created_at", "updated_at",
+            ], restaurant_rows)
+            _copy(cursor, "reviews", [
+                "id", "restaurant_id", "rating", "review_text", "visited_at", "created_at", "updated_at",
+            ], review_rows)
+            _copy(cursor, "restaurant_tags", ["restaurant_id", "tag_id"], tag_rows)
+        connection.commit()
+    finally:
+        connection.close()
+
+    with SessionLocal() as db:
+        UserStatRepository(db).rebuild([user.id for user in seeded])
+        db.commit()
+    # Fresh statistics so the planner sees the collections as they are
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.exec_driver_sql("ANALYZE users, restaurants, reviews, restaurant_tags, user_stats")
+    return seeded
+
+
+def unseed(users: list[SeededUser], place_prefix: str | None = None) -> None:
+    """Delete seeded users with everything the load run created for them."""
+    with SessionLocal() as db:
+        db.query(EmailOutbox).filter(EmailOutbox.to_email.in_([user.email for user in users])).delete()
+        if place_prefix:
+            db.query(Place).filter(Place.google_place_id.startswith(place_prefix)).delete()
+        db.commit()
+    for user in users:
+        delete_user(user.id)
+
+
+def main(users: int = 10, restaurants: int = 1000) -> int:
+    started = time.perf_counter()
+    seeded = seed(users, restaurants)
+    elapsed = time.perf_counter() - started
+    print(f"seeded {users} users x {restaurants} restaurants in {elapsed:.2f}s")
+    unseed(seeded)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:3])))
@@ -0,0 +1,75 @@
+"""Measure request throughput of the restaurant list under concurrency.
+
+Run it once per DATABASE_MODE to compare the sync and async request paths:
+
+    DATABASE_MODE=sync uv run python -m benchmarks.throughput
+    DATABASE_MODE=async uv run python -m benchmarks.throughput
+
+Usage: uv run python -m benchmarks.throughput [concurrency] [seconds]
+"""
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+from prometheus_client import REGISTRY
+
+from benchmarks.common import seed_restaurants, seed_tags, seeded_user
+from src.core.config import settings
+from src.main import app
+
+ROWS = 200
+
+
+async def run(api_key: str, concurrency: int, seconds: float) -> list[float]:
+    latencies: list[float] = []
+    deadline = time.perf_counter() + seconds
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await client.get("/api/v1/restaurants", params={"limit": 50})
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {api_key}"},
+    ) as client:
+        async with app.router.lifespan_context(app):
+            await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+    return latencies
+
+
+def main(concurrency: int = 32, seconds: float = 10.0) -> int:
+    tag_ids = seed_tags(5)
+    with seeded_user() as (user_id, api_key):
+        seed_restaurants(user_id, ROWS, tag_ids)
+        latencies = asyncio.run(run(api_key, concurrency, seconds))
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"mode={settings.database_mode} concurrency={concurrency} "
+        f"requests={len(latencies)} throughput={len(latencies) / seconds:,.0f} req/s "
+        f"p50={statistics.median(latencies) * 1000:.1f}ms p95={p95 * 1000:.1f}ms"
+    )
+    labels = {"pool": settings.database_mode}
+    checkouts = REGISTRY.get_sample_value("crumbs_db_pool_checkout_seconds_count", labels)
+    waited = REGISTRY.get_sample_value("crumbs_db_pool_checkout_seconds_sum", labels)
+    timeouts = REGISTRY.get_sample_value("crumbs_db_pool_checkout_timeouts_total", labels) or 0
+    print(
+        f"pool_size={settings.db_pool_size} max_overflow={settings.db_max_overflow} "
+        f"checkouts={checkouts:.0f} mean_wait={waited / checkouts * 1000:.2f}ms timeouts={timeouts:.0f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    concurrency = int(args[0]) if args else 32
+    seconds = float(args[1]) if len(args) > 1 else 10.0
+    sys.exit(main(concurrency, seconds))
@@ -0,0 +1,40 @@
+"""default timestamps to now() on the server
+
+Revision ID: a7c2e9f4b1d3
+Revises: f3b6d1a8c5e2
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c2e9f4b1d3'
+down_revision: Union[str, Sequence[str], None] = 'f3b6d1a8c5e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = [
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('restaurants', 'created_at'),
+    ('restaurants', 'updated_at'),
+    ('reviews', 'created_at'),
+    ('reviews', 'updated_at'),
+    ('tags', 'created_at'),
+    ('password_reset_tokens', 'created_at'),
+    ('email_outbox', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table, column in COLUMNS:
+        op.alter_column(table, column, server_default=None)
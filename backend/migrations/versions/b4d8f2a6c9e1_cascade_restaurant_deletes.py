@@ -0,0 +1,34 @@
+"""cascade restaurant deletes to reviews and tag links
+
+Revision ID: b4d8f2a6c9e1
+Revises: a7c2e9f4b1d3
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d8f2a6c9e1'
+down_revision: Union[str, Sequence[str], None] = 'a7c2e9f4b1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONSTRAINTS = [
+    ('reviews_restaurant_id_fkey', 'reviews'),
+    ('restaurant_tags_restaurant_id_fkey', 'restaurant_tags'),
+]
+
+
+def upgrade() -> None:
+    for name, table in CONSTRAINTS:
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, 'restaurants', ['restaurant_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    for name, table in CONSTRAINTS:
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, 'restaurants', ['restaurant_id'], ['id'])
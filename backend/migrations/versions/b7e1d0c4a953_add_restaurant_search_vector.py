@@ -0,0 +1,62 @@
+"""add full-text search vector and trigram index to restaurants
+
+Revision ID: b7e1d0c4a953
+Revises: 4f8a2c1d9e07
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e1d0c4a953'
+down_revision: Union[str, Sequence[str], None] = '4f8a2c1d9e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(city, '') || ' ' || coalesce(area, '') || ' ' || coalesce(country, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(notes, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # A stored generated column is computed for every existing row when it
+    # is added, so this also backfills the vectors.
+    op.add_column(
+        'restaurants',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_restaurants_search_vector',
+        'restaurants',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_restaurants_name_trgm',
+        'restaurants',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_restaurants_name_trgm', table_name='restaurants')
+    op.drop_index('ix_restaurants_search_vector', table_name='restaurants')
+    op.drop_column('restaurants', 'search_vector')
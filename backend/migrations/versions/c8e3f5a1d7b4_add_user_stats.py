@@ -0,0 +1,55 @@
+"""add user stats
+
+Revision ID: c8e3f5a1d7b4
+Revises: b4d8f2a6c9e1
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e3f5a1d7b4'
+down_revision: Union[str, Sequence[str], None] = 'b4d8f2a6c9e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same counters as UserStatRepository.rebuild
+BACKFILL = """
+INSERT INTO user_stats (user_id, metric, key, count)
+SELECT user_id, 'total', '', count(*) FROM restaurants GROUP BY user_id
+UNION ALL
+SELECT user_id, 'status', lower(status::text), count(*) FROM restaurants GROUP BY user_id, status
+UNION ALL
+SELECT user_id, 'country', country, count(*) FROM restaurants GROUP BY user_id, country
+UNION ALL
+SELECT user_id, 'city', city, count(*) FROM restaurants GROUP BY user_id, city
+UNION ALL
+SELECT user_id, 'price_range', price_range::text, count(*) FROM restaurants
+WHERE price_range IS NOT NULL GROUP BY user_id, price_range
+UNION ALL
+SELECT user_id, 'favorite', '', count(*) FROM restaurants WHERE is_favorite GROUP BY user_id
+UNION ALL
+SELECT r.user_id, 'rating', v.rating::text, count(*) FROM restaurants r
+JOIN reviews v ON v.restaurant_id = r.id GROUP BY r.user_id, v.rating
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_stats',
+        sa.Column('user_id', sa.Uuid(), nullable=False),
+        sa.Column('metric', sa.String(), nullable=False),
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'metric', 'key'),
+    )
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    op.drop_table('user_stats')
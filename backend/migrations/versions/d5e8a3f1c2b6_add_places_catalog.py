@@ -0,0 +1,39 @@
+"""add places catalog
+
+Revision ID: d5e8a3f1c2b6
+Revises: b7e1d0c4a953
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e8a3f1c2b6'
+down_revision: Union[str, Sequence[str], None] = 'b7e1d0c4a953'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'places',
+        sa.Column('google_place_id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=True),
+        sa.Column('website_url', sa.String(), nullable=True),
+        sa.Column('google_maps_url', sa.String(), nullable=True),
+        sa.Column('country', sa.String(), nullable=True),
+        sa.Column('city', sa.String(), nullable=True),
+        sa.Column('area', sa.String(), nullable=True),
+        sa.Column('price_range', sa.Integer(), nullable=True),
+        sa.Column('photo_reference', sa.String(), nullable=True),
+        sa.Column('fetched_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('google_place_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('places')
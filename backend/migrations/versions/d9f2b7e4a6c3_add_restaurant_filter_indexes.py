@@ -0,0 +1,44 @@
+"""add restaurant filter indexes
+
+Revision ID: d9f2b7e4a6c3
+Revises: c8e3f5a1d7b4
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f2b7e4a6c3'
+down_revision: Union[str, Sequence[str], None] = 'c8e3f5a1d7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_restaurants_user_id_status_created_at_id',
+        'restaurants',
+        ['user_id', 'status', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_restaurants_user_id_created_at_id_favorite',
+        'restaurants',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_favorite'),
+    )
+    # Leads with user_id, so it serves everything the status-only index did
+    op.drop_index('ix_restaurants_status', table_name='restaurants')
+    op.create_index('ix_restaurant_tags_tag_id', 'restaurant_tags', ['tag_id', 'restaurant_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_restaurant_tags_tag_id', table_name='restaurant_tags')
+    op.create_index('ix_restaurants_status', 'restaurants', ['status'], unique=False)
+    op.drop_index('ix_restaurants_user_id_created_at_id_favorite', table_name='restaurants')
+    op.drop_index('ix_restaurants_user_id_status_created_at_id', table_name='restaurants')
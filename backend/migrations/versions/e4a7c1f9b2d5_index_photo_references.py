@@ -0,0 +1,28 @@
+"""index photo references for the photo proxy
+
+Revision ID: e4a7c1f9b2d5
+Revises: d9f2b7e4a6c3
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7c1f9b2d5'
+down_revision: Union[str, Sequence[str], None] = 'd9f2b7e4a6c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_places_photo_reference', 'places', ['photo_reference'], unique=False)
+    op.create_index('ix_restaurants_photo_url', 'restaurants', ['photo_url'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_restaurants_photo_url', table_name='restaurants')
+    op.drop_index('ix_places_photo_reference', table_name='places')
@@ -0,0 +1,55 @@
+"""point stored Google photo URLs at the photo proxy
+
+Revision ID: e9a4c7b2d8f1
+Revises: d5e8a3f1c2b6
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9a4c7b2d8f1'
+down_revision: Union[str, Sequence[str], None] = 'd5e8a3f1c2b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+GOOGLE_PHOTO_URLS = (
+    "photo_url LIKE 'https://maps.googleapis.com/maps/api/place/photo?%' "
+    "AND photo_url ~ '[?&]photoreference=[A-Za-z0-9_-]+'"
+)
+
+
+def upgrade() -> None:
+    # Stored URLs embed the Google API key; replace them with proxy URLs.
+    # The public URL is part of the data written, so it is passed in
+    # rather than read from whatever the app settings are at migration time
+    public_url = context.get_x_argument(as_dictionary=True).get("api_public_url")
+    if not public_url:
+        if not context.is_offline_mode():
+            pending = op.get_bind().execute(
+                sa.text(f"SELECT count(*) FROM restaurants WHERE {GOOGLE_PHOTO_URLS}")
+            ).scalar_one()
+            if pending == 0:
+                return
+        raise RuntimeError(
+            "This migration rewrites stored Google photo URLs to point at the photo proxy "
+            "and needs the API's public URL: "
+            "alembic -x api_public_url=https://api.example.com upgrade head"
+        )
+    op.execute(
+        sa.text(
+            "UPDATE restaurants SET photo_url = :prefix || substring(photo_url from "
+            f"'[?&]photoreference=([A-Za-z0-9_-]+)') WHERE {GOOGLE_PHOTO_URLS}"
+        ).bindparams(prefix=f"{public_url.rstrip('/')}/api/v1/places/photo/")
+    )
+
+
+def downgrade() -> None:
+    raise RuntimeError(
+        "e9a4c7b2d8f1 is irreversible: the original photo URLs carried the "
+        "Google API key, which is not kept anywhere"
+    )
@@ -1,23 +1,30 @@
-from fastapi import Depends, HTTPException, status
+import httpx
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from src.core.database import get_session
+from src.core.database import DbSession, get_session
 from src.services.auth import AuthService
-from src.models.user import User
+from src.schemas.user import CurrentUser
 
 bearer_scheme = HTTPBearer()
 
 
-def get_current_user(
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-    db: Session = Depends(get_session),
-) -> User:
+    db: DbSession = Depends(get_session, scope="function"),
+) -> CurrentUser:
     api_key = credentials.credentials
-    service = AuthService(db)
-    user = service.get_user_from_api_key(api_key)
+    user = AuthService.get_cached_user(api_key)
+    if user is None:
+        service = AuthService(db)
+        user = await service.get_user_from_api_key(api_key)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired API key",
         )
-    return user
\ No newline at end of file
+    return user
+
+
+def get_places_client(request: Request) -> httpx.AsyncClient:
+    """The shared Google Places client created in the app lifespan."""
+    return request.app.state.places_client
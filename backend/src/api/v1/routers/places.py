@@ -1,18 +1,52 @@
-from fastapi import APIRouter, Query
+import httpx
+from fastapi import APIRouter, BackgroundTasks, Depends, Path, Query, Request, Response
+from fastapi.responses import FileResponse
 
+from src.api.v1.dependencies import get_places_client
+from src.core.cache import etag_matches
+from src.core.config import settings
 from src.schemas.places import PlaceSearchResult, PlaceDetailsResponse
+from src.services.photos import PhotoService, PhotoStore
 from src.services.places import PlacesService
 
 router = APIRouter(prefix="/places", tags=["places"])
 
+photo_store = PhotoStore(settings.places_photo_cache_dir, settings.places_photo_cache_max_bytes)
+
 
 @router.get("/search", response_model=list[PlaceSearchResult])
-async def search_places(q: str = Query(..., min_length=2)):
-    service = PlacesService()
+async def search_places(
+    q: str = Query(..., min_length=2),
+    client: httpx.AsyncClient = Depends(get_places_client),
+):
+    service = PlacesService(client)
     return await service.search(q)
 
 
 @router.get("/details/{place_id}", response_model=PlaceDetailsResponse)
-async def get_place_details(place_id: str):
-    service = PlacesService()
-    return await service.get_details(place_id)
+async def get_place_details(
+    place_id: str,
+    background_tasks: BackgroundTasks,
+    client: httpx.AsyncClient = Depends(get_places_client),
+):
+    service = PlacesService(client)
+    return await service.get_details(place_id, background_tasks)
+
+
+@router.get("/photo/{ref}", response_class=FileResponse)
+async def get_place_photo(
+    request: Request,
+    ref: str = Path(..., pattern=r"^[A-Za-z0-9_-]{1,2048}$"),
+    w: int = Query(800, ge=1, le=1600),
+    client: httpx.AsyncClient = Depends(get_places_client),
+):
+    service = PhotoService(PlacesService(client), photo_store)
+    path, digest = await service.get_variant(ref, w)
+    # Variants never change for a given URL, so clients may keep them forever
+    headers = {
+        "ETag": f'"{digest}"',
+        "Cache-Control": "public, max-age=31536000, immutable",
+    }
+    if etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type="image/jpeg", headers=headers)
@@ -1,17 +1,26 @@
 import uuid
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Optional
-from src.core.database import get_session
+from typing import Literal, Optional
+from src.core.database import DbSession, SessionLocal, get_session, run_sync
 from src.services.restaurant import RestaurantService
+from src.services.export import iter_csv, iter_ndjson
 from src.schemas.restaurant import (
     RestaurantCreate,
+    RestaurantBulkCreate,
+    RestaurantBulkResponse,
+    RestaurantBulkDelete,
+    RestaurantBulkDeleteResponse,
+    RestaurantBatch,
+    RestaurantBatchResponse,
     RestaurantUpdate,
     RestaurantResponse,
+    RestaurantPage,
     RestaurantFilters,
 )
 from src.api.v1.dependencies import get_current_user
-from src.models.user import User
+from src.schemas.user import CurrentUser
 
 router = APIRouter(prefix="/restaurants", tags=["restaurants"])
 
@@ -21,17 +30,59 @@ def build_response(restaurant, tags) -> RestaurantResponse:
     return data
 
 @router.post("", response_model=RestaurantResponse, status_code=201)
-def create_restaurant(
+async def create_restaurant(
     data: RestaurantCreate,
-    db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    db: DbSession = Depends(get_session, scope="function"),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    service = RestaurantService(db)
-    restaurant, tags = service.create(user_id=current_user.id, data=data)
-    return build_response(restaurant, tags)
+    def create(s: Session):
+        service = RestaurantService(s)
+        restaurant, tags = service.create(user_id=current_user.id, data=data)
+        return build_response(restaurant, tags)
 
-@router.get("", response_model=list[RestaurantResponse])
-def list_restaurants(
+    return await run_sync(db, create)
+
+@router.post("/bulk", response_model=RestaurantBulkResponse)
+async def bulk_create_restaurants(
+    data: RestaurantBulkCreate,
+    db: DbSession = Depends(get_session, scope="function"),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    def bulk_create(s: Session):
+        service = RestaurantService(s)
+        results = service.bulk_create(user_id=current_user.id, items=data.items)
+        created = sum(1 for r in results if r.id is not None)
+        return RestaurantBulkResponse(created=created, failed=len(results) - created, results=results)
+
+    return await run_sync(db, bulk_create)
+
+@router.post("/bulk-delete", response_model=RestaurantBulkDeleteResponse)
+async def bulk_delete_restaurants(
+    data: RestaurantBulkDelete,
+    db: DbSession = Depends(get_session, scope="function"),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    def bulk_delete(s: Session):
+        service = RestaurantService(s)
+        deleted, not_found = service.bulk_delete(user_id=current_user.id, restaurant_ids=data.ids)
+        return RestaurantBulkDeleteResponse(deleted=deleted, not_found=not_found)
+
+    return await run_sync(db, bulk_delete)
+
+@router.post("/batch", response_model=RestaurantBatchResponse)
+async def batch_update_restaurants(
+    data: RestaurantBatch,
+    db: DbSession = Depends(get_session, scope="function"),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    def batch(s: Session):
+        service = RestaurantService(s)
+        return RestaurantBatchResponse(results=service.batch(user_id=current_user.id, operations=data.operations))
+
+    return await run_sync(db, batch)
+
+@router.get("", response_model=RestaurantPage)
+async def list_restaurants(
     status: Optional[str] = Query(None),
     country: Optional[str] = Query(None),
     city: Optional[str] = Query(None),
@@ -39,8 +90,10 @@ def list_restaurants(
     tag_ids: Optional[list[uuid.UUID]] = Query(None),
     q: Optional[str] = Query(None),
     is_favorite: Optional[bool] = Query(None),
-    db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
+    db: DbSession = Depends(get_session, scope="function"),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     filters = RestaurantFilters(
         status=status,
@@ -51,46 +104,98 @@ def list_restaurants(
         q=q,
         is_favorite=is_favorite,
     )
-    service = RestaurantService(db)
-    results = service.get_all(user_id=current_user.id, filters=filters)
-    return [build_response(r, t) for r, t in results]
+
+    def fetch_page(s: Session):
+        service = RestaurantService(s)
+        results, next_cursor = service.get_all(
+            user_id=current_user.id, filters=filters, limit=limit, cursor=cursor
+        )
+        return RestaurantPage(
+            items=[build_response(r, t) for r, t in results],
+            next_cursor=next_cursor,
+        )
+
+    return await run_sync(db, fetch_page)
+
+@router.get("/export")
+def export_restaurants(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    user_id = current_user.id
+
+    def batches():
+        # The stream outlives the request-scoped session. Each batch is read
+        # by keyset in a short transaction of its own, so a slow client holds
+        # no connection while it reads and cannot hit the idle timeout
+        after = None
+        while True:
+            with SessionLocal() as db:
+                batch, after = RestaurantService(db).export_batch(user_id=user_id, after=after)
+                responses = [build_response(restaurant, tags) for restaurant, tags in batch]
+            if responses:
+                yield responses
+            if after is None:
+                return
+
+    if export_format == "csv":
+        body, media_type = iter_csv(batches()), "text/csv"
+    else:
+        body, media_type = iter_ndjson(batches()), "application/x-ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="crumbs-export.{export_format}"'},
+    )
 
 @router.get("/{restaurant_id}", response_model=RestaurantResponse)
-def get_restaurant(
+async def get_restaurant(
     restaurant_id: uuid.UUID,
-    db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    db: DbSession = Depends(get_session, scope="function"),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    service = RestaurantService(db)
-    restaurant, tags = service.get_by_id(restaurant_id, current_user.id)
-    return build_response(restaurant, tags)
+    def get(s: Session):
+        service = RestaurantService(s)
+        restaurant, tags = service.get_by_id(restaurant_id, current_user.id)
+        return build_response(restaurant, tags)
+
+    return await run_sync(db, get)
 
 @router.patch("/{restaurant_id}", response_model=RestaurantResponse)
-def update_restaurant(
+async def update_restaurant(
     restaurant_id: uuid.UUID,
     data: RestaurantUpdate,
-    db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    db: DbSession = Depends(get_session, scope="function"),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    service = RestaurantService(db)
-    restaurant, tags = service.update(restaurant_id, current_user.id, data)
-    return build_response(restaurant, tags)
+    def update(s: Session):
+        service = RestaurantService(s)
+        restaurant, tags = service.update(restaurant_id, current_user.id, data)
+        return build_response(restaurant, tags)
+
+    return await run_sync(db, update)
 
 @router.delete("/{restaurant_id}", status_code=204)
-def delete_restaurant(
+async def delete_restaurant(
     restaurant_id: uuid.UUID,
-    db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    db: DbSession = Depends(get_session, scope="function"),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    service = RestaurantService(db)
-    service.delete(restaurant_id, current_user.id)
+    def delete(s: Session):
+        service = RestaurantService(s)
+        service.delete(restaurant_id, current_user.id)
+
+    await run_sync(db, delete)
 
 @router.post("/{restaurant_id}/toggle-favorite", response_model=RestaurantResponse)
-def toggle_favorite(
+async def toggle_favorite(
     restaurant_id: uuid.UUID,
-    db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    db: DbSession = Depends(get_session, scope="function"),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    service = RestaurantService(db)
-    restaurant, tags = service.toggle_favorite(restaurant_id, current_user.id)
-    return build_response(restaurant, tags)
\ No newline at end of file
+    def toggle(s: Session):
+        service = RestaurantService(s)
+        restaurant, tags = service.toggle_favorite(restaurant_id, current_user.id)
+        return build_response(restaurant, tags)
+
+    return await run_sync(db, toggle)
\ No newline at end of file
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from src.core.database import DbSession, get_session, run_sync
+from src.services.stats import StatsService
+from src.schemas.stats import StatsResponse
+from src.api.v1.dependencies import get_current_user
+from src.schemas.user import CurrentUser
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get("", response_model=StatsResponse)
+async def get_stats(
+    db: DbSession = Depends(get_session, scope="function"),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    def fetch(s: Session):
+        return StatsService(s).get(current_user.id)
+
+    return await run_sync(db, fetch)
@@ -1,38 +1,55 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
-from src.core.database import get_session
+from src.core.config import settings
+from src.core.database import DbSession, get_session, run_sync
 from src.services.tag import TagService
 from src.schemas.tag import TagCreate, TagResponse, ConfigOptions
 from src.api.v1.dependencies import get_current_user
-from src.models.user import User
+from src.schemas.user import CurrentUser
 
 router = APIRouter(tags=["tags"])
 
 
 @router.post("/tags", response_model=TagResponse, status_code=201)
-def create_tag(
+async def create_tag(
     data: TagCreate,
-    db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    db: DbSession = Depends(get_session, scope="function"),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    service = TagService(db)
-    return service.create(data)
+    def create(s: Session):
+        service = TagService(s)
+        return TagResponse.model_validate(service.create(data))
+
+    return await run_sync(db, create)
 
 
 @router.get("/tags", response_model=list[TagResponse])
-def list_tags(
-    db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+async def list_tags(
+    request: Request,
+    db: DbSession = Depends(get_session, scope="function"),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    service = TagService(db)
-    return service.get_all()
+    payload = TagService.get_cached("tags")
+    if payload is None:
+        def fetch(s: Session):
+            service = TagService(s)
+            return service.get_all_json()
+
+        payload = await run_sync(db, fetch)
+    return payload.to_response(request, settings.tag_cache_max_age_seconds)
 
 
 @router.get("/config/options", response_model=ConfigOptions)
-def get_config_options(
-    db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+async def get_config_options(
+    request: Request,
+    db: DbSession = Depends(get_session, scope="function"),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    service = TagService(db)
-    grouped = service.get_config_options()
-    return ConfigOptions(options=grouped)
\ No newline at end of file
+    payload = TagService.get_cached("config_options")
+    if payload is None:
+        def fetch(s: Session):
+            service = TagService(s)
+            return service.get_config_options_json()
+
+        payload = await run_sync(db, fetch)
+    return payload.to_response(request, settings.tag_cache_max_age_seconds)
@@ -0,0 +1,135 @@
+import asyncio
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from src.core.metrics import CACHE_COALESCED, CACHE_REQUESTS
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded in-process cache whose entries expire after ``ttl_seconds``.
+
+    Safe to share between threadpool workers. Lookups take no lock, as a
+    dict read is atomic under the GIL; writes lock each other out. Past
+    ``max_size`` the entries set longest ago are evicted first; expired
+    ones stay until they are overwritten or evicted. Every lookup is
+    counted as a hit or miss in ``crumbs_cache_requests_total`` under the
+    cache's name. A ``max_size`` of 0 disables caching.
+    """
+
+    def __init__(self, name: str, max_size: int, ttl_seconds: float):
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # Insertion-ordered: set() re-inserts, so the first key is the oldest
+        self._entries: dict[K, tuple[float, V]] = {}
+        self._lock = threading.Lock()
+        self._hits = CACHE_REQUESTS.labels(name, "hit")
+        self._misses = CACHE_REQUESTS.labels(name, "miss")
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self._misses.inc()
+            return None
+        self._hits.inc()
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            while len(self._entries) > self.max_size:
+                del self._entries[next(iter(self._entries))]
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """Drop every entry matching ``predicate`` and return how many went."""
+        with self._lock:
+            keys = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight(Generic[K, V]):
+    """Coalesces concurrent async calls for the same key into one.
+
+    The first caller starts ``fn`` as its own task and everyone asking for
+    the same key meanwhile awaits that task, sharing its result or error.
+    Cancelling one caller (a client disconnecting) does not cancel the call
+    for the others. Shared calls count as ``crumbs_cache_coalesced_total``.
+    """
+
+    def __init__(self, name: str):
+        self._calls: dict[K, asyncio.Task[V]] = {}
+        self._coalesced = CACHE_COALESCED.labels(name)
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self._coalesced.inc()
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Task[V]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the error as retrieved even if every caller went away
+            task.exception()
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names ``etag``."""
+    if_none_match = request.headers.get("if-none-match", "")
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in tags or "*" in tags
+
+
+@dataclass(frozen=True)
+class CachedJSON:
+    """A pre-serialized JSON body with an ETag derived from its content.
+
+    The ETag depends only on the bytes, so every worker (and every CDN
+    edge) agrees on it for the same payload.
+    """
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def dump(cls, type_: Any, value: Any) -> "CachedJSON":
+        adapter = TypeAdapter(type_)
+        body = adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+    def to_response(self, request: Request, max_age: int) -> Response:
+        """Serve the body, or an empty 304 if the client already has it."""
+        headers = {"ETag": self.etag, "Cache-Control": f"public, max-age={max_age}"}
+        if etag_matches(request, self.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
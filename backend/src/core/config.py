@@ -1,4 +1,7 @@
-from typing import Optional
+import re
+import tempfile
+from pathlib import Path
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -12,21 +15,96 @@ class Settings(BaseSettings):
     app_name: str = "Crumbs API"
     app_version: str = "0.1.0"
     debug: bool = False
+    # Where clients reach this API; used for links the API hands out
+    api_public_url: str = "http://localhost:8000"
 
     # Database
     database_url: str
+    # "async" serves requests through asyncpg and AsyncSession
+    database_mode: Literal["sync", "async"] = "sync"
+    # Per engine and per worker process: size the pool so that
+    # workers * (pool_size + max_overflow) stays below max_connections
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    # Applied to every new connection; 0 disables the timeout
+    db_statement_timeout_ms: int = 30_000
+    db_idle_in_transaction_timeout_ms: int = 60_000
+    # Requests issuing more statements than this log a warning; 0 disables.
+    # Override per route template, e.g. {"POST /api/v1/restaurants/batch": 300}
+    request_statement_budget: int = 20
+    request_statement_budgets: dict[str, int] = {}
+    # Statements slower than this go to slow_query_log_file as JSON lines,
+    # with the route that issued them; 0 disables the log
+    slow_query_ms: float = 500.0
+    slow_query_log_file: str = str(Path(tempfile.gettempdir()) / "crumbs-slow-queries.log")
+    slow_query_log_max_bytes: int = 10 * 1024 * 1024
+    slow_query_log_backups: int = 5
+    # Share of slow statements re-run under EXPLAIN on a separate connection,
+    # with ANALYZE and BUFFERS for reads; 0 never explains
+    slow_query_explain_sample_rate: float = 0.0
+    slow_query_explain_timeout_ms: int = 10_000
 
     # Security
     secret_key: str
     allowed_origins: str = "http://localhost:5173"
     api_key_prefix: str = "crumbs"
+    # Resolved API keys are cached per worker; revoked keys keep working
+    # on other workers for at most this long
+    auth_cache_ttl_seconds: float = 60.0
+    auth_cache_max_size: int = 10_000
+    # argon2 cost for new hashes; existing hashes keep the cost they were made with
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65_536  # KiB
+    argon2_parallelism: int = 4
+    # Hashing process pool; 0 workers means one per available core
+    password_hash_workers: int = 0
+    password_hash_queue_size: int = 32
+    # The tag catalog is cached per worker until a tag is created there;
+    # other workers converge within the TTL
+    tag_cache_ttl_seconds: float = 300.0
+    tag_cache_max_age_seconds: int = 60
 
     # Google Places
     google_places_api_key: Optional[str] = None
+    google_places_base_url: str = "https://maps.googleapis.com/maps/api/place"
+    places_max_connections: int = 20
+    places_max_keepalive_connections: int = 10
+    places_keepalive_expiry: float = 30.0
+    places_connect_timeout: float = 3.0
+    places_read_timeout: float = 5.0
+    places_http2: bool = False
+    places_search_cache_ttl_seconds: float = 900.0
+    places_search_cache_max_size: int = 5_000
+    # Catalog rows are served as-is while fresh, served and refreshed in the
+    # background while stale, and refetched before serving once expired
+    places_catalog_fresh_seconds: int = 7 * 24 * 3600
+    places_catalog_max_age_seconds: int = 30 * 24 * 3600
+    places_photo_cache_dir: str = str(Path(tempfile.gettempdir()) / "crumbs-photos")
+    places_photo_widths: list[int] = [200, 400, 800, 1600]
+    # Least recently served photos are deleted beyond this many bytes
+    places_photo_cache_max_bytes: int = 1024 * 1024 * 1024
     
     # Email
     resend_api_key: Optional[str] = None
     email_from: str
     frontend_url: str = "http://localhost:5173"
+    # Emails go through the email_outbox table. Disable the in-app sender
+    # when running it as its own process (python -m src.services.email_outbox)
+    email_outbox_sender_enabled: bool = True
+    email_outbox_batch_size: int = 20
+    email_outbox_poll_seconds: float = 5.0
+    # A claimed email is retried after this long if its sender dies
+    email_outbox_lease_seconds: float = 120.0
+    email_outbox_max_attempts: int = 8
+    # Retries back off exponentially from base up to max, with jitter
+    email_outbox_retry_base_seconds: float = 10.0
+    email_outbox_retry_max_seconds: float = 3600.0
+
+    @property
+    def async_database_url(self) -> str:
+        return re.sub(r"^postgresql(\+\w+)?://", "postgresql+asyncpg://", self.database_url)
 
 settings = Settings()
\ No newline at end of file
@@ -1,22 +1,208 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+import time
+from typing import AsyncIterator, Callable, TypeVar
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Engine, create_engine, event, exc
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from src.core.config import settings
+from src.core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_SECONDS,
+    DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_CONNECTIONS_OPENED,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+)
+from src.core.slow_queries import track_slow_queries
+from src.core.timing import track_statements
+
+T = TypeVar("T")
 
 class Base(DeclarativeBase):
-    pass
+    # Timestamps come from now() on the server; read them back with
+    # RETURNING during flush instead of expiring them and selecting later
+    __mapper_args__ = {"eager_defaults": True}
+
+class _TimedCheckout:
+    """Pool mixin that records how long each checkout waits for a connection."""
+
+    label: str
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(self.label).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.labels(self.label).observe(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    label = "sync"
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    label = "async"
+
+
+def _instrument(bind: Engine, label: str) -> None:
+    """Track pool occupancy through SQLAlchemy pool events.
+
+    Listeners go on the engine rather than the pool, and read ``bind.pool``
+    when they fire, so they keep working after ``dispose()`` swaps the pool.
+    """
+    DB_POOL_SIZE.labels(label).set(bind.pool.size())
+
+    @event.listens_for(bind, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        DB_POOL_CONNECTIONS_OPENED.labels(label).inc()
+
+    @event.listens_for(bind, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKED_OUT.labels(label).inc()
+        DB_POOL_OVERFLOW.labels(label).set(max(bind.pool.overflow(), 0))
+
+    @event.listens_for(bind, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        DB_POOL_CHECKED_OUT.labels(label).dec()
+        # Checkin fires before the connection goes back; if every persistent
+        # slot is already idle it is an overflow connection and gets closed
+        pool = bind.pool
+        overflow = pool.overflow() - (1 if pool.checkedin() >= pool.size() else 0)
+        DB_POOL_OVERFLOW.labels(label).set(max(overflow, 0))
+
+
+def _pool_options() -> dict:
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def _session_settings() -> dict[str, str]:
+    """Server settings sent with the startup packet of every new connection."""
+    return {
+        "statement_timeout": str(settings.db_statement_timeout_ms),
+        "idle_in_transaction_session_timeout": str(settings.db_idle_in_transaction_timeout_ms),
+    }
+
 
+# The sync engine always exists: sync mode serves requests with it, and
+# long-running work such as streaming exports uses it in both modes.
 engine = create_engine(
     settings.database_url,
     echo=settings.debug,
+    poolclass=InstrumentedQueuePool,
+    connect_args={
+        "options": " ".join(f"-c {name}={value}" for name, value in _session_settings().items())
+    },
+    **_pool_options(),
 )
+_instrument(engine, InstrumentedQueuePool.label)
+track_statements(engine)
+track_slow_queries(engine, engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = None
+AsyncSessionLocal = None
+if settings.database_mode == "async":
+    async_engine = create_async_engine(
+        settings.async_database_url,
+        echo=settings.debug,
+        poolclass=InstrumentedAsyncQueuePool,
+        connect_args={"server_settings": _session_settings()},
+        **_pool_options(),
+    )
+    _instrument(async_engine.sync_engine, InstrumentedAsyncQueuePool.label)
+    track_statements(async_engine.sync_engine)
+    track_slow_queries(async_engine.sync_engine, engine)
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
 
-def get_session():
-    """FastAPI dependency that provides a database session per request."""
+DbSession = Session | AsyncSession
+
+
+async def get_session() -> AsyncIterator[DbSession]:
+    """FastAPI dependency that provides a database session per request.
+
+    Yields an AsyncSession in async mode and a Session otherwise. Either way,
+    call repositories and services through run_sync.
+
+    The session is the request's unit of work: repositories only flush, and
+    it commits once after the endpoint returns, or rolls back if it raises.
+    Declare it as ``Depends(get_session, scope="function")`` so the commit
+    happens before the response is sent rather than after.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            yield db
+            await db.commit()
+        return
     db = SessionLocal()
     try:
         yield db
+        await run_in_threadpool(db.commit)
     finally:
-        db.close()
\ No newline at end of file
+        await run_in_threadpool(db.close)
+
+
+def after_commit(db: Session, fn: Callable[[], None]) -> None:
+    """Call ``fn`` once the session's current transaction commits.
+
+    For side effects that must not run before the data is visible, such as
+    invalidating caches. Dropped if the transaction rolls back. ``fn`` may
+    run on a threadpool thread.
+    """
+    db.info.setdefault("after_commit", []).append(fn)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(db: Session) -> None:
+    for fn in db.info.pop("after_commit", []):
+        fn()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit(db: Session) -> None:
+    db.info.pop("after_commit", None)
+
+
+async def run_sync(db: DbSession, fn: Callable[[Session], T]) -> T:
+    """Run session-bound code without blocking the event loop.
+
+    In async mode this is AsyncSession.run_sync, which drives the same
+    repository code over asyncpg. In sync mode it runs on the threadpool.
+    Build response models inside ``fn``; ORM objects must not lazy-load
+    once they are back on the event loop.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn)
+    return await run_in_threadpool(fn, db)
+
+
+async def run_in_new_session(fn: Callable[[Session], T]) -> T:
+    """Like run_sync, for work outside a request such as background tasks.
+
+    ``fn`` runs as its own unit of work and is committed when it returns.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            result = await db.run_sync(fn)
+            await db.commit()
+            return result
+
+    def run(_=None) -> T:
+        with SessionLocal() as db:
+            result = fn(db)
+            db.commit()
+            return result
+
+    return await run_in_threadpool(run)
@@ -0,0 +1,26 @@
+import httpx
+
+from src.core.config import settings
+
+
+def create_places_client(transport: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncClient:
+    """Build the long-lived client used for every Google Places call.
+
+    Created once in the app lifespan so connections (and their TLS sessions)
+    are reused across requests. Pass ``transport`` (e.g. ``httpx.MockTransport``)
+    to run without the network.
+    """
+    return httpx.AsyncClient(
+        base_url=settings.google_places_base_url,
+        transport=transport,
+        http2=settings.places_http2,
+        limits=httpx.Limits(
+            max_connections=settings.places_max_connections,
+            max_keepalive_connections=settings.places_max_keepalive_connections,
+            keepalive_expiry=settings.places_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(
+            settings.places_read_timeout,
+            connect=settings.places_connect_timeout,
+        ),
+    )
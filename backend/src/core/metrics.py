@@ -0,0 +1,163 @@
+"""Prometheus metrics shared across the app.
+
+Gauges use the ``livesum`` multiprocess mode so values from several worker
+processes add up instead of overwriting each other. With several uvicorn
+workers, set ``PROMETHEUS_MULTIPROC_DIR`` to an empty directory before
+start; every worker then writes its values there and ``render`` serves
+the sum of all of them, whichever worker answers the scrape.
+"""
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "crumbs_http_request_duration_seconds",
+    "Request latency by method, route template and status",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "crumbs_http_requests_in_flight",
+    "Requests currently being served",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_SIZE = Gauge(
+    "crumbs_db_pool_size",
+    "Configured number of persistent connections in the pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "crumbs_db_pool_checked_out",
+    "Connections currently checked out of the pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "crumbs_db_pool_overflow",
+    "Connections open beyond pool_size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "crumbs_db_pool_checkout_seconds",
+    "Time spent waiting for a connection from the pool",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "crumbs_db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout",
+    ["pool"],
+)
+DB_POOL_CONNECTIONS_OPENED = Counter(
+    "crumbs_db_pool_connections_opened_total",
+    "New database connections opened by the pool",
+    ["pool"],
+)
+
+PLACES_UPSTREAM_SECONDS = Histogram(
+    "crumbs_places_upstream_seconds",
+    "Google Places call latency by endpoint (autocomplete, details, photo)",
+    ["endpoint"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+PLACES_UPSTREAM_ERRORS = Counter(
+    "crumbs_places_upstream_errors_total",
+    "Failed Google Places calls by endpoint and reason (timeout, transport, http_status, api_status)",
+    ["endpoint", "reason"],
+)
+
+CACHE_REQUESTS = Counter(
+    "crumbs_cache_requests_total",
+    "In-process cache lookups by result",
+    ["cache", "result"],
+)
+CACHE_COALESCED = Counter(
+    "crumbs_cache_coalesced_total",
+    "Cache misses served by an identical call already in flight",
+    ["cache"],
+)
+
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "crumbs_password_hash_in_flight",
+    "argon2 operations running or queued in the hashing pool",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "crumbs_password_hash_rejected_total",
+    "argon2 operations refused with 503 because the hashing pool was full",
+)
+
+EMAIL_OUTBOX_ATTEMPTS = Counter(
+    "crumbs_email_outbox_attempts_total",
+    "Outbox send attempts by result (sent, retry, failed)",
+    ["result"],
+)
+
+
+def _cache_hit_ratios(families) -> GaugeMetricFamily:
+    """Share of lookups per cache served without going to the source.
+
+    Computed at scrape time from ``crumbs_cache_requests_total`` since the
+    workers started; use ``rate()`` over that counter for recent ratios.
+    Stale catalog rows count as served from cache.
+    """
+    served: dict[str, float] = {}
+    total: dict[str, float] = {}
+    for family in families:
+        if family.name != "crumbs_cache_requests":
+            continue
+        for sample in family.samples:
+            if not sample.name.endswith("_total"):
+                continue
+            cache = sample.labels["cache"]
+            total[cache] = total.get(cache, 0) + sample.value
+            if sample.labels["result"] != "miss":
+                served[cache] = served.get(cache, 0) + sample.value
+    ratios = GaugeMetricFamily(
+        "crumbs_cache_hit_ratio", "Share of cache lookups served from cache", labels=["cache"]
+    )
+    for cache, count in sorted(total.items()):
+        if count:
+            ratios.add_metric([cache], served.get(cache, 0) / count)
+    return ratios
+
+
+class _Snapshot:
+    """Collected metric families, in the shape ``generate_latest`` expects."""
+
+    def __init__(self, families):
+        self.families = families
+
+    def collect(self):
+        return self.families
+
+
+def render() -> tuple[bytes, str]:
+    """Exposition body and content type for ``GET /metrics``."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    families = list(registry.collect())
+    families.append(_cache_hit_ratios(families))
+    return generate_latest(_Snapshot(families)), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the shared multiprocess files."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
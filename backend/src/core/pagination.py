@@ -0,0 +1,38 @@
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Callable
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """Pack the sort key of the last row on a page into an opaque cursor."""
+    payload = json.dumps([_dump(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> tuple:
+    """Unpack a cursor, converting each value with the matching parser.
+
+    Raises ValueError if the cursor is malformed or has the wrong shape.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("Malformed cursor") from exc
+    if not isinstance(values, list) or len(values) != len(parsers):
+        raise ValueError("Malformed cursor")
+    try:
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (TypeError, ValueError, AttributeError) as exc:
+        raise ValueError("Malformed cursor") from exc
@@ -1,8 +1,21 @@
+import asyncio
+import multiprocessing
+import os
 import secrets
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 from src.core.config import settings
+from src.core.metrics import PASSWORD_HASH_IN_FLIGHT, PASSWORD_HASH_REJECTED
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__rounds=settings.argon2_time_cost,
+    argon2__memory_cost=settings.argon2_memory_cost,
+    argon2__parallelism=settings.argon2_parallelism,
+)
 
 # --- Password hashing ---
 
@@ -12,9 +25,71 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+# --- Password hashing off the request path ---
+#
+# argon2 is deliberately CPU and memory heavy, so it runs in a dedicated
+# process pool instead of the threadpool that serves requests. At most
+# workers + queue_size operations are admitted; beyond that callers get a
+# 503 right away instead of piling up behind each other.
+
+_executor: ProcessPoolExecutor | None = None
+_in_flight = 0
+
+
+def _workers() -> int:
+    return settings.password_hash_workers or len(os.sched_getaffinity(0))
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn: forking a process that already runs threads and an event
+        # loop is unsafe
+        _executor = ProcessPoolExecutor(
+            max_workers=_workers(), mp_context=multiprocessing.get_context("spawn")
+        )
+    return _executor
+
+
+async def _run_hashing(fn, *args):
+    global _executor, _in_flight
+    if _in_flight >= _workers() + settings.password_hash_queue_size:
+        PASSWORD_HASH_REJECTED.inc()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign-in attempts in progress, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+    _in_flight += 1
+    PASSWORD_HASH_IN_FLIGHT.inc()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_executor(), fn, *args)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM); start a fresh pool for the next call
+        _executor = None
+        raise
+    finally:
+        _in_flight -= 1
+        PASSWORD_HASH_IN_FLIGHT.dec()
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hashing(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_hashing(verify_password, plain_password, hashed_password)
+
+
+def shutdown_password_hashing() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
 # --- API Key generation ---
 
 def generate_api_key() -> str:
     """Generate a new random API key with a readable prefix."""
     token = secrets.token_urlsafe(32)
-    return f"{settings.api_key_prefix}_{token}"
\ No newline at end of file
+    return f"{settings.api_key_prefix}_{token}"
@@ -0,0 +1,185 @@
+"""Log statements slower than ``settings.slow_query_ms`` to a rotating file.
+
+Each slow statement becomes one JSON line with its duration, the route
+that issued it and its SQL normalized so that repeats of one query look
+the same: parameters and literals become ``?`` and IN lists and VALUES
+rows collapse. Parameter values are never written; they may hold
+personal data.
+
+A ``slow_query_explain_sample_rate`` share of slow statements is also
+explained. A background thread re-runs them with their original
+parameters on a connection of its own, inside a transaction it rolls
+back, so the request neither waits for the plan nor shares a transaction
+with it. Reads get ``EXPLAIN (ANALYZE, BUFFERS)``; writes only get
+``EXPLAIN``, as ANALYZE would execute them. When the thread falls behind,
+further slow statements are logged without a plan.
+"""
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+
+from sqlalchemy import Engine, event
+
+from src.core.config import settings
+from src.core.timing import current_timing
+
+logger = logging.getLogger(__name__)
+
+# Slow statements waiting for EXPLAIN; more than this and they go unexplained
+_EXPLAIN_BACKLOG = 16
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PARAMETER = re.compile(r"%\([^)]*\)s|%s|\$\d+")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_CAST = re.compile(r"\?::\w+(?: WITH(?:OUT)? TIME ZONE)?(?:\[\])?")
+_LIST = re.compile(r"\(\?(?:, \?)+\)")
+_ROWS = re.compile(r"(\([^()]*\))(?:, \1)+")
+_EXPLAINABLE = re.compile(r"(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+_WRITES = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|FOR (NO KEY UPDATE|UPDATE|KEY SHARE|SHARE))\b", re.IGNORECASE
+)
+
+
+def normalize_sql(statement: str) -> str:
+    """Reduce a statement to its shape, e.g. ``... WHERE id IN (...) LIMIT ?``."""
+    sql = " ".join(statement.split())
+    sql = _STRING.sub("?", sql)
+    sql = _PARAMETER.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _CAST.sub("?", sql)
+    sql = _LIST.sub("(...)", sql)
+    return _ROWS.sub(r"\1, ...", sql)
+
+
+_file_log = logging.getLogger(f"{__name__}.file")
+_file_log.propagate = False
+_file_log_lock = threading.Lock()
+
+
+def _write(entry: dict) -> None:
+    # Opened on first use, after any worker fork, so "{pid}" in the
+    # path gives every worker process a file of its own to rotate
+    if not _file_log.handlers:
+        with _file_log_lock:
+            if not _file_log.handlers:
+                handler = RotatingFileHandler(
+                    settings.slow_query_log_file.format(pid=os.getpid()),
+                    maxBytes=settings.slow_query_log_max_bytes,
+                    backupCount=settings.slow_query_log_backups,
+                    encoding="utf-8",
+                )
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                _file_log.addHandler(handler)
+                _file_log.setLevel(logging.INFO)
+    _file_log.info(json.dumps(entry, default=str))
+
+
+def _driver_parameters(dialect, statement: str, parameters) -> tuple[str, dict]:
+    """Statement and parameters in the sync engine's paramstyle."""
+    if dialect.paramstyle == "numeric_dollar":
+        # asyncpg's $1, $2 become psycopg2's %(p1)s, %(p2)s
+        statement = re.sub(r"\$(\d+)", r"%(p\1)s", statement.replace("%", "%%"))
+        parameters = {f"p{i}": value for i, value in enumerate(parameters, 1)}
+
+    def plain(value):
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        if isinstance(value, (list, tuple)):
+            return [plain(item) for item in value]
+        return value
+
+    return statement, {name: plain(value) for name, value in (parameters or {}).items()}
+
+
+class _Explainer:
+    """Runs EXPLAIN for sampled slow statements on a thread of its own."""
+
+    def __init__(self, bind: Engine):
+        self.bind = bind
+        self.pending: queue.Queue = queue.Queue(maxsize=_EXPLAIN_BACKLOG)
+        self.thread: threading.Thread | None = None
+        self.lock = threading.Lock()
+
+    def submit(self, entry: dict, statement: str, parameters: dict, analyze: bool) -> bool:
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="slow-query-explain", daemon=True)
+                self.thread.start()
+        try:
+            self.pending.put_nowait((entry, statement, parameters, analyze))
+        except queue.Full:
+            return False
+        return True
+
+    def _run(self) -> None:
+        while True:
+            entry, statement, parameters, analyze = self.pending.get()
+            try:
+                entry["plan"] = self.explain(statement, parameters, analyze)
+            except Exception as exc:
+                entry["plan_error"] = str(exc).strip()
+            _write(entry)
+
+    def explain(self, statement: str, parameters: dict, analyze: bool) -> str:
+        options = "ANALYZE, BUFFERS" if analyze else "COSTS"
+        with self.bind.connect().execution_options(slow_query_log=False) as connection:
+            connection.exec_driver_sql(
+                f"SET LOCAL statement_timeout = {int(settings.slow_query_explain_timeout_ms)}"
+            )
+            rows = connection.exec_driver_sql(f"EXPLAIN ({options}) {statement}", parameters)
+            plan = "\n".join(row[0] for row in rows)
+            connection.rollback()
+        return plan
+
+
+def track_slow_queries(bind: Engine, explain_bind: Engine) -> None:
+    """Log slow statements on ``bind``; EXPLAIN samples through ``explain_bind``.
+
+    ``explain_bind`` must be a sync engine; statements from an asyncpg
+    engine are translated to its paramstyle.
+    """
+    if settings.slow_query_ms <= 0:
+        return
+    threshold = settings.slow_query_ms / 1000
+    explainer = _Explainer(explain_bind)
+
+    @event.listens_for(bind, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info["slow_query_started"] = time.perf_counter()
+
+    @event.listens_for(bind, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info.pop("slow_query_started")
+        if elapsed < threshold or not conn.get_execution_options().get("slow_query_log", True):
+            return
+        timing = current_timing()
+        entry = {
+            "time": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(elapsed * 1000, 1),
+            "route": timing.route if timing is not None else None,
+            "sql": normalize_sql(statement),
+            "pid": os.getpid(),
+        }
+        logger.warning(
+            "Slow query %.1fms on %s: %.200s",
+            entry["duration_ms"], entry["route"] or "no request", entry["sql"],
+            extra={"duration_ms": entry["duration_ms"], "route": entry["route"]},
+        )
+        if (
+            not executemany
+            and _EXPLAINABLE.match(statement.lstrip())
+            and random.random() < settings.slow_query_explain_sample_rate
+        ):
+            analyze = not _WRITES.search(statement)
+            driver_statement, driver_parameters = _driver_parameters(conn.dialect, statement, parameters)
+            if explainer.submit(entry, driver_statement, driver_parameters, analyze):
+                return
+        _write(entry)
@@ -0,0 +1,167 @@
+"""Per-request accounting of SQL statements, database time and Places time.
+
+``RequestTimingMiddleware`` gives every HTTP request a ``RequestTiming``
+through a context variable. Engine events and ``PlacesService`` add to it
+from wherever the work runs: threadpool workers and SQLAlchemy's async
+greenlets both see the request's context. The totals go out as a
+``Server-Timing`` header and as fields of one log record per request, and
+the request's latency goes into ``crumbs_http_request_duration_seconds``.
+"""
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from prometheus_client import Histogram
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS_IN_FLIGHT
+
+logger = logging.getLogger(__name__)
+
+# Histogram children by (method, route, status). labels() takes the
+# metric's lock, so look each one up once and reuse it afterwards
+_latency_children: dict[tuple[str, str, str], Histogram] = {}
+
+
+@dataclass
+class RequestTiming:
+    statements: int = 0
+    db_seconds: float = 0.0
+    places_calls: int = 0
+    places_seconds: float = 0.0
+    scope: Scope = field(default_factory=dict, repr=False)
+
+    @property
+    def route(self) -> str:
+        """Method and route template, e.g. ``GET /api/v1/restaurants/{restaurant_id}``.
+
+        Before routing, or when no route matched, the raw path stands in.
+        """
+        route = self.scope.get("route")
+        return f"{self.scope.get('method')} {route.path if route else self.scope.get('path')}"
+
+    def server_timing(self, total_seconds: float) -> str:
+        metrics = [
+            f'db;dur={self.db_seconds * 1000:.1f};desc="{self.statements} statements"',
+            f"total;dur={total_seconds * 1000:.1f}",
+        ]
+        if self.places_calls:
+            metrics.insert(1, f'places;dur={self.places_seconds * 1000:.1f};desc="{self.places_calls} calls"')
+        return ", ".join(metrics)
+
+
+_current: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+def current_timing() -> RequestTiming | None:
+    """The timing of the request being served, or None outside a request."""
+    return _current.get()
+
+
+def record_places_call(seconds: float) -> None:
+    timing = _current.get()
+    if timing is not None:
+        timing.places_calls += 1
+        timing.places_seconds += seconds
+
+
+def track_statements(bind: Engine) -> None:
+    """Count statements and time spent in the database against the current request."""
+
+    @event.listens_for(bind, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info["statement_started"] = time.perf_counter()
+
+    @event.listens_for(bind, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info.pop("statement_started")
+        timing = _current.get()
+        if timing is not None:
+            timing.statements += 1
+            timing.db_seconds += elapsed
+
+
+def statement_budget(route: str) -> int:
+    """Statements a route may issue before a warning; 0 means no limit."""
+    return settings.request_statement_budgets.get(route, settings.request_statement_budget)
+
+
+def _observe_latency(method: str, route: str, status_code: int, seconds: float) -> None:
+    key = (method, route, str(status_code))
+    child = _latency_children.get(key)
+    if child is None:
+        child = _latency_children[key] = HTTP_REQUEST_SECONDS.labels(*key)
+    child.observe(seconds)
+
+
+class RequestTimingMiddleware:
+    """Adds ``Server-Timing`` to every response, logs and measures each request.
+
+    The header is written when the response starts, so statements issued
+    while streaming a body (exports) only show up in the log record. A
+    request over its statement budget is logged as a warning.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming(scope=scope)
+        token = _current.set(timing)
+        # Exposed to endpoints as request.state.timing
+        scope.setdefault("state", {})["timing"] = timing
+        started = time.perf_counter()
+        status_code = 500
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timing.server_timing(time.perf_counter() - started))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            _current.reset(token)
+            seconds = time.perf_counter() - started
+            route = scope.get("route")
+            # Unmatched paths share a label so scanners cannot blow up the series count
+            _observe_latency(scope["method"], route.path if route else "unmatched", status_code, seconds)
+            self._log(status_code, seconds, timing)
+
+    def _log(self, status_code: int, seconds: float, timing: RequestTiming) -> None:
+        route_name = timing.route
+        fields = {
+            "route": route_name,
+            "status": status_code,
+            "duration_ms": round(seconds * 1000, 1),
+            "db_statements": timing.statements,
+            "db_ms": round(timing.db_seconds * 1000, 1),
+            "places_calls": timing.places_calls,
+            "places_ms": round(timing.places_seconds * 1000, 1),
+        }
+        logger.info(
+            "%s %d %.1fms statements=%d db=%.1fms places=%.1fms",
+            route_name, status_code, fields["duration_ms"], timing.statements,
+            fields["db_ms"], fields["places_ms"],
+            extra=fields,
+        )
+        budget = statement_budget(route_name)
+        if budget and timing.statements > budget:
+            logger.warning(
+                "%s issued %d statements, over its budget of %d",
+                route_name, timing.statements, budget,
+                extra=fields,
+            )
@@ -1,13 +1,29 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from src.core.config import settings
-from src.api.v1.routers import auth, restaurants, reviews, tags, places
+from src.core.database import async_engine
+from src.core.http import create_places_client
+from src.core import metrics
+from src.core.security import shutdown_password_hashing
+from src.core.timing import RequestTimingMiddleware
+from src.services.email_outbox import outbox_sender
+from src.api.v1.routers import auth, restaurants, reviews, tags, places, stats
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print(f"Starting {settings.app_name} v{settings.app_version}")
+    app.state.places_client = create_places_client()
+    if settings.email_outbox_sender_enabled:
+        outbox_sender.start()
     yield
+    if settings.email_outbox_sender_enabled:
+        await outbox_sender.stop()
+    await app.state.places_client.aclose()
+    shutdown_password_hashing()
+    if async_engine is not None:
+        await async_engine.dispose()
+    metrics.mark_process_dead()
     print(f"Shutting down {settings.app_name}")
 
 
@@ -27,15 +43,26 @@ app.add_middleware(
     allow_credentials=allow_credentials,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets browser devtools show Server-Timing for cross-origin calls
+    expose_headers=["Server-Timing"],
 )
+# Added last so it wraps CORS too and times the whole request
+app.add_middleware(RequestTimingMiddleware)
 
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(restaurants.router, prefix="/api/v1")
 app.include_router(reviews.router, prefix="/api/v1")
 app.include_router(tags.router, prefix="/api/v1")
 app.include_router(places.router, prefix="/api/v1")
+app.include_router(stats.router, prefix="/api/v1")
 
 
 @app.get("/health")
 def health_check():
-    return {"status": "ok", "version": settings.app_version}
\ No newline at end of file
+    return {"status": "ok", "version": settings.app_version}
+
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
\ No newline at end of file
@@ -3,6 +3,9 @@ from src.models.restaurant import Restaurant, RestaurantStatus
 from src.models.review import Review
 from src.models.tag import Tag, RestaurantTag
 from src.models.password_reset_token import PasswordResetToken
+from src.models.place import Place
+from src.models.email_outbox import EmailOutbox
+from src.models.user_stat import UserStat
 
 __all__ = [
     "User",
@@ -12,4 +15,7 @@ __all__ = [
     "Tag",
     "RestaurantTag",
     "PasswordResetToken",
+    "Place",
+    "EmailOutbox",
+    "UserStat",
 ]
\ No newline at end of file
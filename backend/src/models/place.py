@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, Integer, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from src.core.database import Base
+
+
+class Place(Base):
+    """Normalized Google place details, shared by every user.
+
+    Stores the photo reference rather than a photo URL so URLs can be built
+    without persisting the API key.
+    """
+    __tablename__ = "places"
+
+    google_place_id: Mapped[str] = mapped_column(String, primary_key=True)
+    name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    website_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    google_maps_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    country: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    city: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    area: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    price_range: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Indexed for the photo proxy, which only fetches known references
+    photo_reference: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
@@ -1,7 +1,8 @@
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Enum, Boolean
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Enum, Boolean, Index, Computed, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.core.database import Base
 import enum
@@ -10,13 +11,21 @@ class RestaurantStatus(str, enum.Enum):
     SAVED = "saved"
     TRIED = "tried"
 
+# Name weighs most, then location, then notes. 'simple' skips stemming
+# because names and places are mostly proper nouns in many languages.
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(city, '') || ' ' || coalesce(area, '') || ' ' || coalesce(country, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(notes, '')), 'C')"
+)
+
 class Restaurant(Base):
     __tablename__ = "restaurants"
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True)
     status: Mapped[RestaurantStatus] = mapped_column(
-        Enum(RestaurantStatus), default=RestaurantStatus.SAVED, index=True
+        Enum(RestaurantStatus), default=RestaurantStatus.SAVED
     )
     name: Mapped[str] = mapped_column(String, index=True)
     country: Mapped[str] = mapped_column(String, index=True)
@@ -25,20 +34,56 @@ class Restaurant(Base):
     website_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     google_maps_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     google_place_id: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
-    photo_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    photo_url: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
     price_range: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     notes: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     is_favorite: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false")
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), deferred=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
+    # Reviews and tag links are removed by ON DELETE CASCADE
     review: Mapped[Optional["Review"]] = relationship(
-        "Review", back_populates="restaurant", uselist=False, lazy="joined"
-    )
\ No newline at end of file
+        "Review", back_populates="restaurant", uselist=False, lazy="joined", passive_deletes=True
+    )
+
+
+# Serves keyset pagination of a user's list, newest first
+Index(
+    "ix_restaurants_user_id_created_at_id",
+    Restaurant.user_id,
+    Restaurant.created_at.desc(),
+    Restaurant.id.desc(),
+)
+# The same order for the status and favorite filters, which the list
+# pages apply most, so they stop after one page instead of sorting
+Index(
+    "ix_restaurants_user_id_status_created_at_id",
+    Restaurant.user_id,
+    Restaurant.status,
+    Restaurant.created_at.desc(),
+    Restaurant.id.desc(),
+)
+Index(
+    "ix_restaurants_user_id_created_at_id_favorite",
+    Restaurant.user_id,
+    Restaurant.created_at.desc(),
+    Restaurant.id.desc(),
+    postgresql_where=Restaurant.is_favorite,
+)
+Index("ix_restaurants_search_vector", Restaurant.search_vector, postgresql_using="gin")
+Index(
+    "ix_restaurants_name_trgm",
+    Restaurant.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+)
@@ -1,7 +1,7 @@
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
-from sqlalchemy import Integer, String, DateTime, ForeignKey
+from sqlalchemy import Integer, String, DateTime, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.core.database import Base
 
@@ -11,7 +11,7 @@ class Review(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     restaurant_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("restaurants.id"), unique=True, index=True
+        ForeignKey("restaurants.id", ondelete="CASCADE"), unique=True, index=True
     )
     rating: Mapped[int] = mapped_column(Integer)
     review_text: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -20,12 +20,12 @@ class Review(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
     restaurant: Mapped["Restaurant"] = relationship(
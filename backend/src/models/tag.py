@@ -1,6 +1,6 @@
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import String, DateTime, ForeignKey
+from datetime import datetime
+from sqlalchemy import String, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 from src.core.database import Base
 
@@ -14,7 +14,7 @@ class Tag(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
 
 
@@ -22,8 +22,12 @@ class RestaurantTag(Base):
     __tablename__ = "restaurant_tags"
 
     restaurant_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("restaurants.id"), primary_key=True
+        ForeignKey("restaurants.id", ondelete="CASCADE"), primary_key=True
     )
     tag_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("tags.id"), primary_key=True
-    )
\ No newline at end of file
+    )
+
+
+# The primary key leads with restaurant_id; the tag filter looks up by tag
+Index("ix_restaurant_tags_tag_id", RestaurantTag.tag_id, RestaurantTag.restaurant_id)
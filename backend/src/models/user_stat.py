@@ -0,0 +1,20 @@
+import uuid
+from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from src.core.database import Base
+
+
+class UserStat(Base):
+    """One counter of a user's collection summary, e.g. ``("country", "Japan")``.
+
+    Writes to restaurants and reviews adjust these counters in the same
+    transaction, so reading a user's stats never scans their restaurants.
+    """
+    __tablename__ = "user_stats"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    metric: Mapped[str] = mapped_column(String, primary_key=True)  # total, status, country, city, ...
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from src.models.email_outbox import EmailOutbox
+
+
+class EmailOutboxRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(self, to_email: str, subject: str, html: str) -> EmailOutbox:
+        """Add an email to the caller's transaction; it is queued on commit."""
+        message = EmailOutbox(to_email=to_email, subject=subject, html=html)
+        self.db.add(message)
+        return message
+
+    def claim_due(self, limit: int, now: datetime, lease: timedelta) -> list[EmailOutbox]:
+        """Claim up to ``limit`` due emails for ``lease``, counting an attempt.
+
+        SKIP LOCKED lets several senders drain the outbox without picking
+        the same rows. Commit before sending so the claim holds.
+        """
+        due = (
+            select(EmailOutbox.id)
+            .where(
+                EmailOutbox.sent_at.is_(None),
+                EmailOutbox.failed_at.is_(None),
+                EmailOutbox.next_attempt_at <= now,
+            )
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        claimed = self.db.scalars(
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(due.scalar_subquery()))
+            .values(next_attempt_at=now + lease, attempts=EmailOutbox.attempts + 1)
+            .returning(EmailOutbox)
+            .execution_options(synchronize_session=False)
+        ).all()
+        # Detach so the rows stay readable after commit, outside the session
+        for message in claimed:
+            self.db.expunge(message)
+        return list(claimed)
+
+    def mark_sent(self, message_id, sent_at: datetime) -> None:
+        self.db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id == message_id)
+            .values(sent_at=sent_at, last_error=None)
+        )
+
+    def mark_failed(self, message_id, error: str, retry_at: datetime | None, now: datetime) -> None:
+        """Record a failed attempt, to retry at ``retry_at`` or give up if None."""
+        values = {"last_error": error}
+        if retry_at is None:
+            values["failed_at"] = now
+        else:
+            values["next_attempt_at"] = retry_at
+        self.db.execute(update(EmailOutbox).where(EmailOutbox.id == message_id).values(**values))
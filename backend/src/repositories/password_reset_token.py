@@ -1,4 +1,6 @@
+import uuid
 from datetime import datetime
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
 from src.models.password_reset_token import PasswordResetToken
 
@@ -10,13 +12,25 @@ class PasswordResetTokenRepository:
     def create(self, user_id, token: str, expires_at: datetime) -> PasswordResetToken:
         record = PasswordResetToken(user_id=user_id, token=token, expires_at=expires_at)
         self.db.add(record)
-        self.db.commit()
-        self.db.refresh(record)
+        self.db.flush()
         return record
 
     def get_by_token(self, token: str) -> PasswordResetToken | None:
         return self.db.query(PasswordResetToken).filter(PasswordResetToken.token == token).first()
 
-    def mark_used(self, token_record: PasswordResetToken) -> None:
-        token_record.used = True
-        self.db.commit()
+    def consume(self, token: str) -> uuid.UUID | None:
+        """Mark a valid token used and return its user, in one statement.
+
+        Returns None if the token is unknown, expired or already used, so
+        two concurrent resets cannot both use it.
+        """
+        return self.db.execute(
+            update(PasswordResetToken)
+            .where(
+                PasswordResetToken.token == token,
+                PasswordResetToken.used.is_(False),
+                PasswordResetToken.expires_at > func.now(),
+            )
+            .values(used=True)
+            .returning(PasswordResetToken.user_id)
+        ).scalar_one_or_none()
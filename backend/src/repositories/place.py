@@ -0,0 +1,33 @@
+from datetime import datetime
+from sqlalchemy import exists, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from src.models.place import Place
+from src.models.restaurant import Restaurant
+
+
+class PlaceRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, google_place_id: str) -> Place | None:
+        return self.db.get(Place, google_place_id)
+
+    def upsert(self, google_place_id: str, data: dict, fetched_at: datetime) -> None:
+        values = {**data, "fetched_at": fetched_at}
+        self.db.execute(
+            insert(Place)
+            .values(google_place_id=google_place_id, **values)
+            .on_conflict_do_update(index_elements=[Place.google_place_id], set_=values)
+        )
+
+    def is_known_photo(self, photo_reference: str, photo_url: str) -> bool:
+        """Whether the catalog or a saved restaurant hands out this photo.
+
+        Restaurants keep the proxy URL they were saved with, which outlives
+        the catalog row once a refresh brings a different photo reference.
+        """
+        return self.db.scalar(select(or_(
+            exists().where(Place.photo_reference == photo_reference),
+            exists().where(Restaurant.photo_url == photo_url),
+        )))
@@ -1,12 +1,50 @@
+import re
 import uuid
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import ColumnElement, Table, any_, cast, delete, func, insert, literal, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, DOUBLE_PRECISION, insert as pg_insert
+from sqlalchemy.sql.selectable import TableValuedAlias
 from src.models.restaurant import Restaurant
 from src.models.review import Review
 from src.models.tag import Tag, RestaurantTag
+from src.repositories.user_stat import SUMMARY_COLUMNS, RestaurantSummary
 from src.schemas.restaurant import RestaurantFilters
 
 
+def _search(q: str) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    """Build the match condition and relevance rank for a free-text search.
+
+    Every word is prefix-matched against the ``search_vector`` column, and
+    the name is also compared by trigram word similarity so typos still hit.
+    """
+    similarity = func.word_similarity(q, Restaurant.name)
+    match = literal(q).op("<%")(Restaurant.name)
+    rank = similarity
+    terms = re.findall(r"[^\W_]+", q.lower())
+    if terms:
+        ts_query = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        match = or_(Restaurant.search_vector.op("@@")(ts_query), match)
+        rank = func.ts_rank(Restaurant.search_vector, ts_query) + similarity
+    # Double precision so the rank survives a round trip through the cursor
+    return match, cast(rank, DOUBLE_PRECISION)
+
+
+def _unnest(table: Table, columns: dict[str, list]) -> TableValuedAlias:
+    """Zip one bound array per column into rows, typed like the target table."""
+    return func.unnest(
+        *(cast(values, ARRAY(table.c[name].type)) for name, values in columns.items())
+    ).table_valued(*columns).render_derived()
+
+
+def _in_array(column, values) -> ColumnElement[bool]:
+    """``column = ANY(:array)``: one bound array instead of one parameter per value.
+
+    Keeps ID lists of any length under asyncpg's 32767-parameter limit
+    and the statement text the same size, however many IDs are sent.
+    """
+    return column == any_(cast(list(values), ARRAY(column.type)))
+
+
 class RestaurantRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -18,8 +56,37 @@ class RestaurantRepository:
             .first()
         )
 
-    def get_all(self, user_id: uuid.UUID, filters: RestaurantFilters) -> list[Restaurant]:
+    def get_by_id_for_update(self, restaurant_id: uuid.UUID, user_id: uuid.UUID) -> Restaurant | None:
+        """Like get_by_id, but lock the restaurant row until the transaction ends.
+
+        Read-modify-write paths use this so that two requests changing the
+        same restaurant run one after the other and each sees the other's
+        result. Postgres re-reads only the locked row after waiting for the
+        lock; the joined review is as of the statement start.
+        """
+        return (
+            self.db.query(Restaurant)
+            .filter(Restaurant.id == restaurant_id, Restaurant.user_id == user_id)
+            .with_for_update(of=Restaurant)
+            .populate_existing()
+            .first()
+        )
+
+    def get_all(
+        self,
+        user_id: uuid.UUID,
+        filters: RestaurantFilters,
+        limit: int,
+        after: tuple | None = None,
+    ) -> list[tuple[Restaurant, tuple]]:
+        """Return up to ``limit`` restaurants after the given keyset position.
+
+        Each restaurant comes with its sort key so the caller can build the
+        next cursor. Lists are ordered newest first; searches (``filters.q``)
+        are ordered by relevance first, so their keys start with the rank.
+        """
         query = self.db.query(Restaurant).filter(Restaurant.user_id == user_id)
+        sort_columns = [Restaurant.created_at, Restaurant.id]
 
         if filters.status:
             query = query.filter(Restaurant.status == filters.status)
@@ -35,61 +102,181 @@ class RestaurantRepository:
         if filters.price_range:
             query = query.filter(Restaurant.price_range == filters.price_range)
         if filters.q:
+            match, rank = _search(filters.q)
+            query = query.filter(match)
+            sort_columns.insert(0, rank)
+        if filters.tag_ids:
+            # Semi-join so a restaurant matching several tags appears once per page
             query = query.filter(
-                or_(
-                    Restaurant.name.ilike(f"%{filters.q}%"),
-                    Restaurant.city.ilike(f"%{filters.q}%"),
-                    Restaurant.country.ilike(f"%{filters.q}%"),
-                    Restaurant.area.ilike(f"%{filters.q}%"),
-                    Restaurant.notes.ilike(f"%{filters.q}%"),
+                Restaurant.id.in_(
+                    select(RestaurantTag.restaurant_id)
+                    .where(RestaurantTag.tag_id.in_(filters.tag_ids))
                 )
             )
-        if filters.tag_ids:
-            query = (
-                query.join(RestaurantTag)
-                .filter(RestaurantTag.tag_id.in_(filters.tag_ids))
-            )
         if filters.is_favorite is not None:
             query = query.filter(Restaurant.is_favorite == filters.is_favorite)
 
-        return query.order_by(Restaurant.created_at.desc()).all()
+        if after:
+            query = query.filter(tuple_(*sort_columns) < after)
+
+        rows = (
+            query.add_columns(*sort_columns)
+            .order_by(*(column.desc() for column in sort_columns))
+            .limit(limit)
+            .all()
+        )
+        return [(row[0], tuple(row[1:])) for row in rows]
 
     def create(self, user_id: uuid.UUID, data: dict) -> Restaurant:
-        restaurant = Restaurant(user_id=user_id, **data)
+        # A new restaurant has no review; saying so saves a lazy load later
+        restaurant = Restaurant(user_id=user_id, review=None, **data)
         self.db.add(restaurant)
-        self.db.commit()
-        self.db.refresh(restaurant)
+        self.db.flush()
         return restaurant
 
+    def bulk_create(
+        self, user_id: uuid.UUID, rows: list[dict], tag_ids: list[list[uuid.UUID]]
+    ) -> list[uuid.UUID]:
+        """Insert many restaurants and their tag links in one transaction.
+
+        Each table is filled by a single ``INSERT ... SELECT FROM unnest(...)``
+        that binds one array per column, so statement size and parse cost stay
+        flat no matter how many rows are sent. Returns the new IDs in the same
+        order as ``rows``.
+        """
+        ids = [uuid.uuid4() for _ in rows]
+        columns = {"id": ids, **{key: [row[key] for row in rows] for key in rows[0]}}
+        source = _unnest(Restaurant.__table__, columns)
+        self.db.execute(
+            insert(Restaurant).from_select(
+                [*columns, "user_id", "created_at", "updated_at"],
+                select(
+                    *source.c,
+                    literal(user_id, Restaurant.user_id.type),
+                    func.now(),
+                    func.now(),
+                ),
+            )
+        )
+        links = [
+            (restaurant_id, tag_id)
+            for restaurant_id, restaurant_tag_ids in zip(ids, tag_ids)
+            for tag_id in restaurant_tag_ids
+        ]
+        if links:
+            source = _unnest(
+                RestaurantTag.__table__,
+                {"restaurant_id": [r for r, _ in links], "tag_id": [t for _, t in links]},
+            )
+            self.db.execute(
+                insert(RestaurantTag).from_select(["restaurant_id", "tag_id"], select(*source.c))
+            )
+        return ids
+
     def update(self, restaurant: Restaurant, data: dict) -> Restaurant:
         for key, value in data.items():
             setattr(restaurant, key, value)
-        self.db.commit()
-        self.db.refresh(restaurant)
+        self.db.flush()
         return restaurant
 
-    def delete(self, restaurant: Restaurant) -> None:
-        self.db.query(RestaurantTag).filter(
-            RestaurantTag.restaurant_id == restaurant.id
-        ).delete()
-        self.db.query(Review).filter(
-            Review.restaurant_id == restaurant.id
-        ).delete()
-        self.db.delete(restaurant)
-        self.db.commit()
+    def delete_many(
+        self, user_id: uuid.UUID, restaurant_ids: list[uuid.UUID]
+    ) -> list[tuple[uuid.UUID, RestaurantSummary]]:
+        """Delete the user's restaurants among ``restaurant_ids`` in one statement.
+
+        Reviews and tag links go with them through ON DELETE CASCADE. Returns
+        the ID and stats summary of each deleted restaurant; IDs of other
+        users' restaurants are ignored.
+        """
+        # The cascade runs at the end of the statement, so the review is still there
+        rating = select(Review.rating).where(Review.restaurant_id == Restaurant.id).scalar_subquery()
+        rows = self.db.execute(
+            delete(Restaurant)
+            .where(Restaurant.user_id == user_id, _in_array(Restaurant.id, restaurant_ids))
+            .returning(Restaurant.id, *SUMMARY_COLUMNS, rating)
+            .execution_options(synchronize_session=False)
+        )
+        return [(row[0], RestaurantSummary(*row[1:])) for row in rows]
+
+    def add_tags(self, restaurant: Restaurant, tag_ids: list[uuid.UUID]) -> None:
+        self.db.add_all(RestaurantTag(restaurant_id=restaurant.id, tag_id=tag_id) for tag_id in tag_ids)
+        self.db.flush()
 
     def set_tags(self, restaurant: Restaurant, tag_ids: list[uuid.UUID]) -> None:
         self.db.query(RestaurantTag).filter(
             RestaurantTag.restaurant_id == restaurant.id
         ).delete()
-        for tag_id in tag_ids:
-            self.db.add(RestaurantTag(restaurant_id=restaurant.id, tag_id=tag_id))
-        self.db.commit()
+        self.add_tags(restaurant, tag_ids)
 
-    def get_tags(self, restaurant_id: uuid.UUID) -> list[Tag]:
-        return (
-            self.db.query(Tag)
-            .join(RestaurantTag)
-            .filter(RestaurantTag.restaurant_id == restaurant_id)
+    def get_owned_ids(self, user_id: uuid.UUID, restaurant_ids) -> set[uuid.UUID]:
+        """Return which of ``restaurant_ids`` belong to the user."""
+        if not restaurant_ids:
+            return set()
+        return set(self.db.scalars(
+            select(Restaurant.id).where(Restaurant.user_id == user_id, _in_array(Restaurant.id, restaurant_ids))
+        ))
+
+    def update_many(
+        self, user_id: uuid.UUID, restaurant_ids: list[uuid.UUID], values: dict
+    ) -> list[tuple[RestaurantSummary, RestaurantSummary]]:
+        """Apply the same column values to many restaurants in one UPDATE.
+
+        Returns each updated restaurant's stats summary before and after. The
+        old values come from a locking CTE, so a concurrent update of the same
+        rows is waited for rather than read stale. Reviews are not touched, so
+        the summaries carry no rating.
+        """
+        old = (
+            select(Restaurant.id, *SUMMARY_COLUMNS)
+            .where(Restaurant.user_id == user_id, _in_array(Restaurant.id, restaurant_ids))
+            .with_for_update()
+            .cte("old")
+        )
+        rows = self.db.execute(
+            update(Restaurant)
+            .where(Restaurant.id == old.c.id)
+            .values(**values)
+            .returning(*list(old.c)[1:], *SUMMARY_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        columns = len(SUMMARY_COLUMNS)
+        return [(RestaurantSummary(*row[:columns]), RestaurantSummary(*row[columns:])) for row in rows]
+
+    def add_tags_many(self, restaurant_ids: list[uuid.UUID], tag_ids: list[uuid.UUID]) -> None:
+        """Link every tag to every restaurant in one INSERT, keeping existing links."""
+        pairs = [(restaurant_id, tag_id) for restaurant_id in restaurant_ids for tag_id in tag_ids]
+        source = _unnest(
+            RestaurantTag.__table__,
+            {"restaurant_id": [r for r, _ in pairs], "tag_id": [t for _, t in pairs]},
+        )
+        self.db.execute(
+            pg_insert(RestaurantTag)
+            .from_select(["restaurant_id", "tag_id"], select(*source.c))
+            .on_conflict_do_nothing()
+        )
+
+    def remove_tags_many(self, restaurant_ids: list[uuid.UUID], tag_ids: list[uuid.UUID] | None = None) -> None:
+        """Unlink ``tag_ids`` (every tag if None) from many restaurants in one DELETE."""
+        statement = delete(RestaurantTag).where(_in_array(RestaurantTag.restaurant_id, restaurant_ids))
+        if tag_ids is not None:
+            statement = statement.where(_in_array(RestaurantTag.tag_id, tag_ids))
+        self.db.execute(statement)
+
+    def get_tags_for(self, restaurant_ids: list[uuid.UUID]) -> dict[uuid.UUID, list[Tag]]:
+        """Load tags for many restaurants in a single query."""
+        tags_by_restaurant: dict[uuid.UUID, list[Tag]] = {rid: [] for rid in restaurant_ids}
+        if not restaurant_ids:
+            return tags_by_restaurant
+        rows = (
+            self.db.query(RestaurantTag.restaurant_id, Tag)
+            .join(Tag, Tag.id == RestaurantTag.tag_id)
+            .filter(RestaurantTag.restaurant_id.in_(restaurant_ids))
             .all()
-        )
\ No newline at end of file
+        )
+        for restaurant_id, tag in rows:
+            tags_by_restaurant[restaurant_id].append(tag)
+        return tags_by_restaurant
+
+    def with_tags(self, restaurants: list[Restaurant]) -> list[tuple[Restaurant, list[Tag]]]:
+        tags_by_restaurant = self.get_tags_for([r.id for r in restaurants])
+        return [(r, tags_by_restaurant[r.id]) for r in restaurants]
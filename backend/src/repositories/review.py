@@ -11,6 +11,7 @@ class ReviewRepository:
         return (
             self.db.query(Review)
             .filter(Review.restaurant_id == restaurant_id)
+            .populate_existing()
             .first()
         )
 
@@ -22,18 +23,16 @@ class ReviewRepository:
             visited_at=visited_at,
         )
         self.db.add(review)
-        self.db.commit()
-        self.db.refresh(review)
+        self.db.flush()
         return review
 
     def update(self, review: Review, rating: int, review_text: str | None, visited_at) -> Review:
         review.rating = rating
         review.review_text = review_text
         review.visited_at = visited_at
-        self.db.commit()
-        self.db.refresh(review)
+        self.db.flush()
         return review
 
     def delete(self, review: Review) -> None:
         self.db.delete(review)
-        self.db.commit()
\ No newline at end of file
+        self.db.flush()
\ No newline at end of file
@@ -12,14 +12,18 @@ class TagRepository:
     def get_by_id(self, tag_id) -> Tag | None:
         return self.db.query(Tag).filter(Tag.id == tag_id).first()
 
+    def get_existing_ids(self, tag_ids) -> set:
+        if not tag_ids:
+            return set()
+        return {row.id for row in self.db.query(Tag.id).filter(Tag.id.in_(tag_ids))}
+
     def get_by_name(self, name: str) -> Tag | None:
         return self.db.query(Tag).filter(Tag.name == name).first()
 
     def create(self, name: str, category: str) -> Tag:
         tag = Tag(name=name, category=category)
         self.db.add(tag)
-        self.db.commit()
-        self.db.refresh(tag)
+        self.db.flush()
         return tag
 
     def get_grouped_by_category(self) -> dict[str, list[Tag]]:
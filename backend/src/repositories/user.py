@@ -1,3 +1,4 @@
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from src.models.user import User
 
@@ -22,8 +23,7 @@ class UserRepository:
             api_key=api_key,
         )
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
         return user
 
     def email_exists(self, email: str) -> bool:
@@ -32,6 +32,5 @@ class UserRepository:
     def username_exists(self, username: str) -> bool:
         return self.db.query(User).filter(User.username == username).first() is not None
 
-    def update_password(self, user: User, password_hash: str) -> None:
-        user.password_hash = password_hash
-        self.db.commit()
\ No newline at end of file
+    def update_password(self, user_id, password_hash: str) -> None:
+        self.db.execute(update(User).where(User.id == user_id).values(password_hash=password_hash))
\ No newline at end of file
@@ -0,0 +1,131 @@
+import uuid
+from collections import Counter
+from typing import Iterable, NamedTuple
+from sqlalchemy import ColumnElement, Select, String, cast, delete, func, insert, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from src.models.restaurant import Restaurant, RestaurantStatus
+from src.models.review import Review
+from src.models.user_stat import UserStat
+
+StatKey = tuple[str, str]
+
+# The restaurant columns the stats depend on, in RestaurantSummary order
+SUMMARY_COLUMNS = (
+    Restaurant.status,
+    Restaurant.country,
+    Restaurant.city,
+    Restaurant.price_range,
+    Restaurant.is_favorite,
+)
+
+
+class RestaurantSummary(NamedTuple):
+    """What one restaurant contributes to its owner's stats."""
+    status: RestaurantStatus
+    country: str
+    city: str
+    price_range: int | None = None
+    is_favorite: bool = False
+    rating: int | None = None
+
+    @classmethod
+    def of(cls, restaurant: Restaurant) -> "RestaurantSummary":
+        review = restaurant.review
+        return cls(
+            restaurant.status,
+            restaurant.country,
+            restaurant.city,
+            restaurant.price_range,
+            restaurant.is_favorite,
+            review.rating if review else None,
+        )
+
+    def keys(self) -> list[StatKey]:
+        keys = [
+            ("total", ""),
+            ("status", RestaurantStatus(self.status).value),
+            ("country", self.country),
+            ("city", self.city),
+        ]
+        if self.price_range is not None:
+            keys.append(("price_range", str(self.price_range)))
+        if self.is_favorite:
+            keys.append(("favorite", ""))
+        if self.rating is not None:
+            keys.append(("rating", str(self.rating)))
+        return keys
+
+
+def stats_delta(
+    changes: Iterable[tuple[RestaurantSummary | None, RestaurantSummary | None]],
+) -> Counter[StatKey]:
+    """Net counter changes for ``(before, after)`` pairs; None for created or deleted."""
+    delta: Counter[StatKey] = Counter()
+    for before, after in changes:
+        if before is not None:
+            delta.subtract(before.keys())
+        if after is not None:
+            delta.update(after.keys())
+    return delta
+
+
+def _counts(metric: str, key: ColumnElement | None = None, *conditions) -> Select:
+    """Count restaurants per user (and per ``key``) as user_stats rows."""
+    query = (
+        select(
+            Restaurant.user_id,
+            literal(metric, String),
+            key if key is not None else literal("", String),
+            func.count(),
+        )
+        .where(*conditions)
+        .group_by(Restaurant.user_id)
+    )
+    return query.group_by(key) if key is not None else query
+
+
+class UserStatRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, user_id: uuid.UUID) -> list[UserStat]:
+        return list(self.db.scalars(
+            select(UserStat).where(UserStat.user_id == user_id, UserStat.count > 0)
+        ))
+
+    def apply(self, user_id: uuid.UUID, delta: Counter[StatKey]) -> None:
+        """Add ``delta`` to the user's counters in one upsert.
+
+        Rows are written in key order so concurrent writers lock them in the
+        same order and cannot deadlock each other.
+        """
+        changes = sorted((key, count) for key, count in delta.items() if count)
+        if not changes:
+            return
+        statement = pg_insert(UserStat).values([
+            {"user_id": user_id, "metric": metric, "key": key, "count": count}
+            for (metric, key), count in changes
+        ])
+        self.db.execute(statement.on_conflict_do_update(
+            index_elements=[UserStat.user_id, UserStat.metric, UserStat.key],
+            set_={"count": UserStat.count + statement.excluded.count},
+        ))
+
+    def rebuild(self, user_ids: list[uuid.UUID] | None = None) -> None:
+        """Recompute counters from the restaurants themselves (all users if None)."""
+        scope = [Restaurant.user_id.in_(user_ids)] if user_ids is not None else []
+        counts = union_all(
+            _counts("total", None, *scope),
+            _counts("status", func.lower(cast(Restaurant.status, String)), *scope),
+            _counts("country", Restaurant.country, *scope),
+            _counts("city", Restaurant.city, *scope),
+            _counts("price_range", cast(Restaurant.price_range, String), Restaurant.price_range.is_not(None), *scope),
+            _counts("favorite", None, Restaurant.is_favorite, *scope),
+            _counts("rating", cast(Review.rating, String), *scope).join(Review, Review.restaurant_id == Restaurant.id),
+        )
+        stale = delete(UserStat)
+        if user_ids is not None:
+            stale = stale.where(UserStat.user_id.in_(user_ids))
+        self.db.execute(stale)
+        self.db.execute(insert(UserStat).from_select(["user_id", "metric", "key", "count"], counts))
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Annotated, Literal, Optional, Union
 import uuid
 from datetime import datetime
 from src.schemas.tag import TagResponse
@@ -20,6 +20,19 @@ class RestaurantCreate(BaseModel):
     tag_ids: list[uuid.UUID] = []
 
 
+class RestaurantBulkCreate(BaseModel):
+    items: list[RestaurantCreate] = Field(min_length=1, max_length=5000)
+
+
+class RestaurantBulkDelete(BaseModel):
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=5000)
+
+
+class RestaurantBulkDeleteResponse(BaseModel):
+    deleted: int
+    not_found: list[uuid.UUID]
+
+
 class RestaurantUpdate(BaseModel):
     name: Optional[str] = None
     country: Optional[str] = None
@@ -34,6 +47,59 @@ class RestaurantUpdate(BaseModel):
     tag_ids: Optional[list[uuid.UUID]] = None
 
 
+class BatchSetFavorite(BaseModel):
+    op: Literal["set_favorite"]
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=5000)
+    is_favorite: bool
+
+
+class BatchSetStatus(BaseModel):
+    op: Literal["set_status"]
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=5000)
+    status: Literal["saved", "tried"]
+
+
+class BatchAddTags(BaseModel):
+    op: Literal["add_tags"]
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=5000)
+    tag_ids: list[uuid.UUID] = Field(min_length=1, max_length=100)
+
+
+class BatchRemoveTags(BaseModel):
+    op: Literal["remove_tags"]
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=5000)
+    tag_ids: list[uuid.UUID] = Field(min_length=1, max_length=100)
+
+
+class BatchPatch(BaseModel):
+    """Apply the same field changes to every listed restaurant."""
+    op: Literal["patch"]
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=5000)
+    fields: RestaurantUpdate
+
+
+BatchOperation = Annotated[
+    Union[BatchSetFavorite, BatchSetStatus, BatchAddTags, BatchRemoveTags, BatchPatch],
+    Field(discriminator="op"),
+]
+
+
+class RestaurantBatch(BaseModel):
+    operations: list[BatchOperation] = Field(min_length=1, max_length=100)
+
+
+class BatchOperationResult(BaseModel):
+    index: int
+    op: str
+    updated: int = 0
+    not_found: list[uuid.UUID] = []
+    error: Optional[str] = None
+
+
+class RestaurantBatchResponse(BaseModel):
+    results: list[BatchOperationResult]
+
+
 class RestaurantResponse(BaseModel):
     id: uuid.UUID
     user_id: uuid.UUID
@@ -58,6 +124,23 @@ class RestaurantResponse(BaseModel):
         from_attributes = True
 
 
+class RestaurantPage(BaseModel):
+    items: list[RestaurantResponse]
+    next_cursor: Optional[str] = None
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    id: Optional[uuid.UUID] = None
+    error: Optional[str] = None
+
+
+class RestaurantBulkResponse(BaseModel):
+    created: int
+    failed: int
+    results: list[BulkItemResult]
+
+
 class RestaurantFilters(BaseModel):
     status: Optional[str] = None
     country: Optional[str] = None
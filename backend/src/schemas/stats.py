@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class StatsResponse(BaseModel):
+    total: int
+    favorites: int
+    by_status: dict[str, int]
+    by_country: dict[str, int]
+    by_city: dict[str, int]
+    by_price_range: dict[int, int]
+    rating_histogram: dict[int, int]
+    reviewed: int
+    average_rating: Optional[float]
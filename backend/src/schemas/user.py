@@ -20,6 +20,17 @@ class UserResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class CurrentUser(BaseModel):
+    """Detached snapshot of the authenticated user, safe to cache across requests."""
+    id: uuid.UUID
+    email: str
+    username: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+        frozen = True
+
 class TokenResponse(BaseModel):
     api_key: str
     user: UserResponse
\ No newline at end of file
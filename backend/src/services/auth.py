@@ -1,44 +1,96 @@
+import uuid
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from src.repositories.user import UserRepository
-from src.core.security import hash_password, verify_password, generate_api_key
-from src.schemas.user import UserRegister, UserLogin
-from src.models.user import User
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.database import DbSession, run_sync
+from src.core.security import hash_password_async, verify_password_async, generate_api_key
+from src.schemas.user import CurrentUser, UserRegister, UserLogin, UserResponse
+
+# API key -> user snapshot, so authenticating a known key needs no query
+api_key_cache: TTLCache[str, CurrentUser] = TTLCache(
+    "auth", settings.auth_cache_max_size, settings.auth_cache_ttl_seconds
+)
 
 class AuthService:
-    def __init__(self, db: Session):
-        self.repo = UserRepository(db)
+    """Registration, login and API key resolution.
 
-    def register(self, data: UserRegister) -> tuple[User, str]:
-        if self.repo.email_exists(data.email):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered",
-            )
-        if self.repo.username_exists(data.username):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already taken",
-            )
+    Unlike most services this one is async: password hashing runs in the
+    hashing process pool, so database steps go through run_sync around it
+    instead of the whole method running inside one run_sync call.
+    """
 
+    def __init__(self, db: DbSession):
+        self.db = db
+
+    async def register(self, data: UserRegister) -> tuple[UserResponse, str]:
+        def check_available(s: Session) -> None:
+            repo = UserRepository(s)
+            if repo.email_exists(data.email):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Email already registered",
+                )
+            if repo.username_exists(data.username):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Username already taken",
+                )
+
+        await run_sync(self.db, check_available)
+        password_hash = await hash_password_async(data.password)
         api_key = generate_api_key()
-        user = self.repo.create(
-            email=data.email,
-            username=data.username,
-            password_hash=hash_password(data.password),
-            api_key=api_key,
-        )
-        return user, api_key
 
-    def login(self, data: UserLogin) -> tuple[User, str]:
-        user = self.repo.get_by_email(data.email)
-        if not user or not verify_password(data.password, user.password_hash):
+        def create(s: Session) -> UserResponse:
+            user = UserRepository(s).create(
+                email=data.email,
+                username=data.username,
+                password_hash=password_hash,
+                api_key=api_key,
+            )
+            return UserResponse.model_validate(user)
+
+        return await run_sync(self.db, create), api_key
+
+    async def login(self, data: UserLogin) -> tuple[UserResponse, str]:
+        def find(s: Session):
+            user = UserRepository(s).get_by_email(data.email)
+            if not user:
+                return None
+            return UserResponse.model_validate(user), user.password_hash, user.api_key
+
+        found = await run_sync(self.db, find)
+        if not found or not await verify_password_async(data.password, found[1]):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password",
             )
+        user, _, api_key = found
         # Return the stored plain key — same key every time
-        return user, user.api_key
+        return user, api_key
+
+    @staticmethod
+    def get_cached_user(api_key: str) -> CurrentUser | None:
+        return api_key_cache.get(api_key)
+
+    async def get_user_from_api_key(self, api_key: str) -> CurrentUser | None:
+        """Look the key up in the database and cache the result."""
+        def lookup(s: Session) -> CurrentUser | None:
+            user = UserRepository(s).get_by_api_key(api_key)
+            return CurrentUser.model_validate(user) if user else None
+
+        snapshot = await run_sync(self.db, lookup)
+        if snapshot:
+            api_key_cache.set(api_key, snapshot)
+        return snapshot
+
+    @staticmethod
+    def invalidate_api_key(api_key: str) -> None:
+        """Forget a cached key; call this when a key is rotated or revoked."""
+        api_key_cache.pop(api_key)
 
-    def get_user_from_api_key(self, api_key: str) -> User | None:
-        return self.repo.get_by_api_key(api_key)
\ No newline at end of file
+    @staticmethod
+    def invalidate_user(user_id: uuid.UUID) -> None:
+        """Forget every cached key of a user after their account changes."""
+        api_key_cache.discard_where(lambda _, user: user.id == user_id)
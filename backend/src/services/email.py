@@ -2,12 +2,20 @@ import resend
 from src.core.config import settings
 
 
-def send_password_reset_email(to_email: str, reset_link: str) -> None:
+def password_reset_email(reset_link: str) -> tuple[str, str]:
+    """Subject and HTML body of the password reset email."""
+    return (
+        "Reset your Crumbs password",
+        f"<p>Click the link below to reset your password:</p><p><a href=\"{reset_link}\">{reset_link}</a></p>",
+    )
+
+
+def send_email(to_email: str, subject: str, html: str) -> None:
     resend.api_key = settings.resend_api_key
 
     resend.Emails.send({
         "from": settings.email_from,
         "to": to_email,
-        "subject": "Reset your Crumbs password",
-        "html": f"<p>Click the link below to reset your password:</p><p><a href=\"{reset_link}\">{reset_link}</a></p>",
+        "subject": subject,
+        "html": html,
     })
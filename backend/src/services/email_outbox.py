@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.database import run_in_new_session
+from src.core.metrics import EMAIL_OUTBOX_ATTEMPTS
+from src.models.email_outbox import EmailOutbox
+from src.repositories.email_outbox import EmailOutboxRepository
+from src.services.email import send_email
+
+logger = logging.getLogger(__name__)
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff with jitter after ``attempts`` failed sends."""
+    delay = settings.email_outbox_retry_base_seconds * 2 ** (attempts - 1)
+    return min(delay, settings.email_outbox_retry_max_seconds) * random.uniform(0.5, 1.0)
+
+
+class EmailOutboxSender:
+    """Drains the email outbox in batches, retrying failed sends with backoff.
+
+    Polls every ``email_outbox_poll_seconds``; ``wake()`` starts a drain
+    right away for emails queued in this process. Delivery is at least
+    once: an email whose sender dies mid-send goes out again after its lease.
+    """
+
+    def __init__(self):
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def wake(self) -> None:
+        """Drain now instead of at the next poll; safe from any thread."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def start(self) -> None:
+        self._stopping = False
+        # An Event binds to the loop that first waits on it, so each run
+        # (each app lifespan) gets a new one
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Let the current batch finish, then stop."""
+        self._stopping = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        try:
+            await self._drain_until_stopped()
+        finally:
+            self._loop = None
+
+    async def _drain_until_stopped(self) -> None:
+        while not self._stopping:
+            self._wakeup.clear()
+            try:
+                claimed = await self.drain_batch()
+            except Exception:
+                logger.exception("Email outbox drain failed")
+                claimed = 0
+            if claimed < settings.email_outbox_batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), settings.email_outbox_poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def drain_batch(self) -> int:
+        """Send one batch of due emails and return how many were claimed."""
+        lease = timedelta(seconds=settings.email_outbox_lease_seconds)
+        messages = await run_in_new_session(
+            lambda s: EmailOutboxRepository(s).claim_due(
+                settings.email_outbox_batch_size, datetime.now(timezone.utc), lease
+            )
+        )
+        if not messages:
+            return 0
+        errors = await asyncio.gather(*(self._send(message) for message in messages))
+        await run_in_new_session(lambda s: self._record(s, messages, errors))
+        return len(messages)
+
+    async def _send(self, message: EmailOutbox) -> str | None:
+        try:
+            await run_in_threadpool(send_email, message.to_email, message.subject, message.html)
+        except Exception as e:
+            return f"{type(e).__name__}: {e}"
+        return None
+
+    def _record(self, s: Session, messages: list[EmailOutbox], errors: list[str | None]) -> None:
+        repo = EmailOutboxRepository(s)
+        now = datetime.now(timezone.utc)
+        for message, error in zip(messages, errors):
+            if error is None:
+                repo.mark_sent(message.id, now)
+                EMAIL_OUTBOX_ATTEMPTS.labels("sent").inc()
+            elif message.attempts >= settings.email_outbox_max_attempts:
+                logger.error("Giving up on email %s after %d attempts: %s", message.id, message.attempts, error)
+                repo.mark_failed(message.id, error, None, now)
+                EMAIL_OUTBOX_ATTEMPTS.labels("failed").inc()
+            else:
+                logger.warning("Email %s attempt %d failed: %s", message.id, message.attempts, error)
+                retry_at = now + timedelta(seconds=retry_delay(message.attempts))
+                repo.mark_failed(message.id, error, retry_at, now)
+                EMAIL_OUTBOX_ATTEMPTS.labels("retry").inc()
+
+
+outbox_sender = EmailOutboxSender()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(outbox_sender.run())
+    except KeyboardInterrupt:
+        pass
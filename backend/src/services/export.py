@@ -0,0 +1,79 @@
+import csv
+import io
+from typing import Iterable, Iterator
+
+from src.schemas.restaurant import RestaurantResponse
+
+CSV_COLUMNS = [
+    "id",
+    "status",
+    "name",
+    "country",
+    "city",
+    "area",
+    "website_url",
+    "google_maps_url",
+    "google_place_id",
+    "photo_url",
+    "price_range",
+    "notes",
+    "is_favorite",
+    "tags",
+    "rating",
+    "review_text",
+    "visited_at",
+    "created_at",
+    "updated_at",
+]
+
+
+def _csv_row(r: RestaurantResponse) -> list:
+    return [
+        r.id,
+        r.status,
+        r.name,
+        r.country,
+        r.city,
+        r.area,
+        r.website_url,
+        r.google_maps_url,
+        r.google_place_id,
+        r.photo_url,
+        r.price_range,
+        r.notes,
+        r.is_favorite,
+        "; ".join(tag.name for tag in r.tags),
+        r.review.rating if r.review else None,
+        r.review.review_text if r.review else None,
+        r.review.visited_at.isoformat() if r.review and r.review.visited_at else None,
+        r.created_at.isoformat(),
+        r.updated_at.isoformat(),
+    ]
+
+
+# Both take batches and yield one chunk per batch: StreamingResponse
+# iterates a sync body in the threadpool, one hop per chunk
+
+
+def iter_ndjson(batches: Iterable[list[RestaurantResponse]]) -> Iterator[str]:
+    for batch in batches:
+        yield "".join(restaurant.model_dump_json() + "\n" for restaurant in batch)
+
+
+def iter_csv(batches: Iterable[list[RestaurantResponse]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    # The header goes out with the first batch, or alone when there is none
+    writer.writerow(CSV_COLUMNS)
+    for batch in batches:
+        writer.writerows(_csv_row(r) for r in batch)
+        yield flush()
+    if buffer.tell():
+        yield flush()
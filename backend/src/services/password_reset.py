@@ -5,34 +5,63 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from src.core.config import settings
-from src.core.security import hash_password
+from src.core.database import DbSession, after_commit, run_sync
+from src.core.security import hash_password_async
+from src.models.password_reset_token import PasswordResetToken
+from src.repositories.email_outbox import EmailOutboxRepository
 from src.repositories.password_reset_token import PasswordResetTokenRepository
 from src.repositories.user import UserRepository
-from src.services.email import send_password_reset_email
+from src.services.auth import AuthService
+from src.services.email import password_reset_email
+from src.services.email_outbox import outbox_sender
+
+
+def _invalid_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid or expired password reset token.",
+    )
+
+
+def _valid_token(token_repo: PasswordResetTokenRepository, token: str) -> PasswordResetToken:
+    record = token_repo.get_by_token(token)
+    if not record or record.used or record.expires_at < datetime.now(timezone.utc):
+        raise _invalid_token()
+    return record
 
 
 class PasswordResetService:
-    def __init__(self, db: Session):
-        self.user_repo = UserRepository(db)
-        self.token_repo = PasswordResetTokenRepository(db)
+    """Async for the same reason as AuthService: hashing runs in its own pool."""
 
-    def request_reset(self, email: str) -> str:
-        user = self.user_repo.get_by_email(email)
-        if user:
+    def __init__(self, db: DbSession):
+        self.db = db
+
+    async def request_reset(self, email: str) -> str:
+        def create_token(s: Session) -> None:
+            user = UserRepository(s).get_by_email(email)
+            if not user:
+                return
             token = secrets.token_urlsafe(32)
             expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
-            self.token_repo.create(user.id, token, expires_at)
             reset_link = f"{settings.frontend_url}/reset-password?token={token}"
-            send_password_reset_email(to_email=email, reset_link=reset_link)
+            # Committed with the token by the request's unit of work
+            EmailOutboxRepository(s).enqueue(email, *password_reset_email(reset_link))
+            PasswordResetTokenRepository(s).create(user.id, token, expires_at)
+            after_commit(s, outbox_sender.wake)
+
+        await run_sync(self.db, create_token)
         return "If that email is registered, you'll receive a password reset link shortly."
 
-    def reset_password(self, token: str, new_password: str) -> None:
-        record = self.token_repo.get_by_token(token)
-        if not record or record.used or record.expires_at < datetime.now(timezone.utc):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid or expired password reset token.",
-            )
-        user = self.user_repo.get_by_id(record.user_id)
-        self.user_repo.update_password(user, hash_password(new_password))
-        self.token_repo.mark_used(record)
+    async def reset_password(self, token: str, new_password: str) -> None:
+        await run_sync(self.db, lambda s: _valid_token(PasswordResetTokenRepository(s), token))
+        password_hash = await hash_password_async(new_password)
+
+        def apply(s: Session):
+            # Consuming checks again: the token may have been used while we were hashing
+            user_id = PasswordResetTokenRepository(s).consume(token)
+            if user_id is None:
+                raise _invalid_token()
+            UserRepository(s).update_password(user_id, password_hash)
+            after_commit(s, lambda: AuthService.invalidate_user(user_id))
+
+        await run_sync(self.db, apply)
@@ -0,0 +1,182 @@
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from PIL import Image
+
+from src.core.cache import SingleFlight
+from src.core.config import settings
+from src.core.database import run_in_new_session
+from src.core.metrics import CACHE_REQUESTS
+from src.repositories.place import PlaceRepository
+from src.services.places import PlacesService, photo_proxy_url
+
+photo_flight: SingleFlight[str, None] = SingleFlight("places_photo")
+
+
+class PhotoStore:
+    """Content-addressed on-disk store for resized place photos.
+
+    Image bytes live under ``objects/`` named by their SHA-256, so identical
+    variants are stored once and the hash doubles as the ETag. Small files
+    under ``refs/`` map a photo reference and width to an object hash.
+    Every file is written to a temp file and renamed into place, so readers
+    never see a partial image.
+
+    Objects are kept under ``max_bytes``: serving one bumps its mtime, and
+    once a write takes the store over the limit the least recently served
+    objects are deleted down to 90% of it, with the refs pointing at them.
+    The running total is per process and only an estimate; every eviction
+    recounts the directory, which other workers may share.
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int | None = None):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.jpg"
+
+    def _ref_path(self, ref: str, width: int) -> Path:
+        key = hashlib.sha256(ref.encode()).hexdigest()
+        return self.root / "refs" / key[:2] / f"{key}-{width}"
+
+    def lookup(self, ref: str, width: int) -> tuple[Path, str] | None:
+        """Return ``(path, digest)`` of a stored variant, if any."""
+        try:
+            digest = self._ref_path(ref, width).read_text()
+        except FileNotFoundError:
+            return None
+        path = self._object_path(digest)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path, digest
+
+    def put(self, ref: str, variants: dict[int, bytes]) -> None:
+        written = 0
+        for width, data in variants.items():
+            digest = hashlib.sha256(data).hexdigest()
+            path = self._object_path(digest)
+            if not path.exists():
+                _write_atomic(path, data)
+                written += len(data)
+            _write_atomic(self._ref_path(ref, width), digest.encode())
+        if self.max_bytes is None:
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._objects())
+            else:
+                self._size += written
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _objects(self) -> list[tuple[float, int, Path]]:
+        found = []
+        for path in (self.root / "objects").glob("*/*.jpg"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            found.append((stat.st_mtime, stat.st_size, path))
+        return found
+
+    def _evict(self) -> None:
+        objects = sorted(self._objects())
+        total = sum(size for _, size, _ in objects)
+        target = self.max_bytes * 0.9
+        removed = set()
+        for _, size, path in objects:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            removed.add(path.stem)
+            total -= size
+        self._size = total
+        if not removed:
+            return
+        for ref in (self.root / "refs").glob("*/*"):
+            try:
+                if ref.read_text() in removed:
+                    ref.unlink(missing_ok=True)
+            except FileNotFoundError:
+                continue
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def make_variants(data: bytes, widths: list[int]) -> dict[int, bytes]:
+    """Resize an image to each width (never upscaling) as progressive JPEG."""
+    try:
+        image = Image.open(io.BytesIO(data))
+        image = image.convert("RGB")
+    except (OSError, Image.DecompressionBombError):
+        raise HTTPException(status_code=502, detail="Google Places returned an invalid photo")
+
+    variants = {}
+    for width in widths:
+        variant = image
+        if image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            variant = image.resize((width, height), Image.Resampling.LANCZOS)
+        out = io.BytesIO()
+        variant.save(out, "JPEG", quality=82, optimize=True, progressive=True)
+        variants[width] = out.getvalue()
+    return variants
+
+
+def snap_width(width: int) -> int:
+    """The smallest configured variant at least ``width`` wide."""
+    widths = sorted(settings.places_photo_widths)
+    return next((w for w in widths if w >= width), widths[-1])
+
+
+class PhotoService:
+    def __init__(self, places: PlacesService, store: PhotoStore):
+        self.places = places
+        self.store = store
+
+    async def get_variant(self, ref: str, width: int) -> tuple[Path, str]:
+        """Return the stored variant for ``ref``, fetching from Google once."""
+        width = snap_width(width)
+        stored = self.store.lookup(ref, width)
+        if stored:
+            CACHE_REQUESTS.labels("places_photo", "hit").inc()
+            return stored
+        CACHE_REQUESTS.labels("places_photo", "miss").inc()
+        # Fetches are billed, so only proxy photos this API handed out
+        known = await run_in_new_session(
+            lambda s: PlaceRepository(s).is_known_photo(ref, photo_proxy_url(ref))
+        )
+        if not known:
+            raise HTTPException(status_code=404, detail="Photo not found")
+        await photo_flight.do(ref, lambda: self._fetch_into_store(ref))
+        stored = self.store.lookup(ref, width)
+        if not stored:
+            raise HTTPException(status_code=404, detail="Photo not found")
+        return stored
+
+    async def _fetch_into_store(self, ref: str) -> None:
+        widths = sorted(settings.places_photo_widths)
+        data = await self.places.fetch_photo(ref, widths[-1])
+        variants = await run_in_threadpool(make_variants, data, widths)
+        await run_in_threadpool(self.store.put, ref, variants)
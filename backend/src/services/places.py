@@ -1,30 +1,115 @@
+import time
+from datetime import datetime, timezone
+
 import httpx
-from fastapi import HTTPException
+from fastapi import BackgroundTasks, HTTPException
+from sqlalchemy.orm import Session
 
+from src.core.cache import SingleFlight, TTLCache
 from src.core.config import settings
+from src.core.database import run_in_new_session
+from src.core.metrics import CACHE_REQUESTS, PLACES_UPSTREAM_ERRORS, PLACES_UPSTREAM_SECONDS
+from src.core.timing import record_places_call
+from src.repositories.place import PlaceRepository
 from src.schemas.places import PlaceSearchResult, PlaceDetailsResponse
 
+# Normalized query -> autocomplete predictions, shared by every user
+search_cache: TTLCache[str, list[PlaceSearchResult]] = TTLCache(
+    "places_search", settings.places_search_cache_max_size, settings.places_search_cache_ttl_seconds
+)
+search_flight: SingleFlight[str, list[PlaceSearchResult]] = SingleFlight("places_search")
+details_flight: SingleFlight[str, dict] = SingleFlight("places_catalog")
+
+DETAIL_FIELDS = (
+    "name",
+    "website_url",
+    "google_maps_url",
+    "country",
+    "city",
+    "area",
+    "price_range",
+    "photo_reference",
+)
+
+
+def normalize_query(q: str) -> str:
+    return " ".join(q.casefold().split())
+
+
+def _endpoint(path: str) -> str:
+    """Metric label for a Places API path, e.g. /details/json -> details."""
+    return path.strip("/").split("/")[0]
+
 
 class PlacesService:
-    async def search(self, q: str) -> list[PlaceSearchResult]:
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+
+    async def _request(self, path: str, params: dict, **kwargs) -> httpx.Response:
         if not settings.google_places_api_key:
             raise HTTPException(status_code=503, detail="Google Places API not configured")
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://maps.googleapis.com/maps/api/place/autocomplete/json",
-                params={
-                    "input": q,
-                    "types": "establishment",
-                    "key": settings.google_places_api_key,
-                },
+        endpoint = _endpoint(path)
+        started = time.perf_counter()
+        try:
+            response = await self.client.get(
+                path, params={**params, "key": settings.google_places_api_key}, **kwargs
             )
+        except httpx.TimeoutException:
+            PLACES_UPSTREAM_ERRORS.labels(endpoint, "timeout").inc()
+            raise HTTPException(status_code=504, detail="Google Places API timed out")
+        except httpx.HTTPError:
+            PLACES_UPSTREAM_ERRORS.labels(endpoint, "transport").inc()
+            raise HTTPException(status_code=502, detail="Google Places API error")
+        finally:
+            elapsed = time.perf_counter() - started
+            PLACES_UPSTREAM_SECONDS.labels(endpoint).observe(elapsed)
+            record_places_call(elapsed)
+        if response.status_code >= 400:
+            PLACES_UPSTREAM_ERRORS.labels(endpoint, "http_status").inc()
+        return response
+
+    async def _get(self, path: str, params: dict) -> dict:
+        response = await self._request(path, params)
+        # Google reports API errors in a 200 body; anything else is an outage
+        if response.status_code != 200:
+            raise HTTPException(status_code=502, detail="Google Places API error")
+        return response.json()
+
+    async def fetch_photo(self, photo_reference: str, max_width: int) -> bytes:
+        # Google answers with a redirect to the image itself
+        response = await self._request(
+            "/photo",
+            {"photoreference": photo_reference, "maxwidth": max_width},
+            follow_redirects=True,
+        )
+        if response.status_code in (400, 403, 404):
+            raise HTTPException(status_code=404, detail="Photo not found")
+        if response.status_code != 200:
+            raise HTTPException(status_code=502, detail="Google Places API error")
+        return response.content
+
+    async def search(self, q: str) -> list[PlaceSearchResult]:
+        """Autocomplete ``q``, from cache when possible.
 
-        data = response.json()
+        Concurrent misses for the same normalized query share one upstream
+        call. Errors are not cached.
+        """
+        key = normalize_query(q)
+        results = search_cache.get(key)
+        if results is None:
+            results = await search_flight.do(key, lambda: self._search(key))
+        return results
+
+    async def _search(self, q: str) -> list[PlaceSearchResult]:
+        data = await self._get(
+            "/autocomplete/json",
+            {"input": q, "types": "establishment"},
+        )
         if data.get("status") not in ("OK", "ZERO_RESULTS"):
+            PLACES_UPSTREAM_ERRORS.labels("autocomplete", "api_status").inc()
             raise HTTPException(status_code=502, detail="Google Places API error")
 
-        return [
+        results = [
             PlaceSearchResult(
                 place_id=p["place_id"],
                 description=p["description"],
@@ -33,23 +118,80 @@ class PlacesService:
             )
             for p in data.get("predictions", [])
         ]
+        search_cache.set(q, results)
+        return results
 
-    async def get_details(self, place_id: str) -> PlaceDetailsResponse:
-        if not settings.google_places_api_key:
-            raise HTTPException(status_code=503, detail="Google Places API not configured")
+    async def get_details(
+        self, place_id: str, background_tasks: BackgroundTasks
+    ) -> PlaceDetailsResponse:
+        """Serve place details from the shared catalog.
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://maps.googleapis.com/maps/api/place/details/json",
-                params={
-                    "place_id": place_id,
-                    "fields": "name,website,url,formatted_address,address_components,price_level,geometry,photos",
-                    "key": settings.google_places_api_key,
-                },
-            )
+        Fresh rows are returned as-is. Stale rows are returned and refreshed
+        after the response is sent. Missing or expired rows are fetched from
+        Google first; if that fails, an expired row is still served.
+        """
+        def load(s: Session):
+            place = PlaceRepository(s).get(place_id)
+            if not place:
+                return None
+            return place.fetched_at, {field: getattr(place, field) for field in DETAIL_FIELDS}
+
+        # A short session of its own, so no connection is held while a miss
+        # waits on Google; the catalog write after it takes another
+        cached = await run_in_new_session(load)
+        if cached:
+            fetched_at, data = cached
+            age = (datetime.now(timezone.utc) - fetched_at).total_seconds()
+            if age < settings.places_catalog_fresh_seconds:
+                CACHE_REQUESTS.labels("places_catalog", "hit").inc()
+                return _details_response(place_id, data)
+            if age < settings.places_catalog_max_age_seconds:
+                CACHE_REQUESTS.labels("places_catalog", "stale").inc()
+                background_tasks.add_task(self.refresh, place_id)
+                return _details_response(place_id, data)
+
+        CACHE_REQUESTS.labels("places_catalog", "miss").inc()
+        try:
+            data = await details_flight.do(place_id, lambda: self._fetch_into_catalog(place_id))
+        except HTTPException:
+            if not cached:
+                raise
+            data = cached[1]
+        return _details_response(place_id, data)
+
+    async def refresh(self, place_id: str) -> None:
+        """Refetch a catalog row unless another request already did."""
+        def fetched_at(s: Session):
+            place = PlaceRepository(s).get(place_id)
+            return place.fetched_at if place else None
+
+        last = await run_in_new_session(fetched_at)
+        if last and (datetime.now(timezone.utc) - last).total_seconds() < settings.places_catalog_fresh_seconds:
+            return
+        try:
+            await details_flight.do(place_id, lambda: self._fetch_into_catalog(place_id))
+        except HTTPException:
+            # Keep serving the stale row; the next request retries
+            pass
 
-        data = response.json()
+    async def _fetch_into_catalog(self, place_id: str) -> dict:
+        # Shared by every request waiting on this place, so it must not use
+        # the session of the request that happened to start it
+        data = await self._fetch_details(place_id)
+        fetched_at = datetime.now(timezone.utc)
+        await run_in_new_session(lambda s: PlaceRepository(s).upsert(place_id, data, fetched_at))
+        return data
+
+    async def _fetch_details(self, place_id: str) -> dict:
+        data = await self._get(
+            "/details/json",
+            {
+                "place_id": place_id,
+                "fields": "name,website,url,formatted_address,address_components,price_level,geometry,photos",
+            },
+        )
         if data.get("status") != "OK":
+            PLACES_UPSTREAM_ERRORS.labels("details", "api_status").inc()
             raise HTTPException(status_code=502, detail="Google Places API error")
 
         result = data["result"]
@@ -62,25 +204,31 @@ class PlacesService:
         price_level = result.get("price_level")
 
         photos = result.get("photos", [])
-        photo_ref = photos[0]["photo_reference"] if photos else None
-        photo_url = (
-            f"https://maps.googleapis.com/maps/api/place/photo"
-            f"?maxwidth=800&photoreference={photo_ref}&key={settings.google_places_api_key}"
-        ) if photo_ref else None
-
-        return PlaceDetailsResponse(
-            place_id=place_id,
-            name=result.get("name"),
-            website_url=result.get("website"),
-            google_maps_url=result.get("url"),
-            country=components.get("country"),
-            city=components.get("locality") or components.get("administrative_area_level_2"),
-            area=(
+
+        return {
+            "name": result.get("name"),
+            "website_url": result.get("website"),
+            "google_maps_url": result.get("url"),
+            "country": components.get("country"),
+            "city": components.get("locality") or components.get("administrative_area_level_2"),
+            "area": (
                 components.get("sublocality_level_1")
                 or components.get("sublocality")
                 or components.get("neighborhood")
                 or components.get("administrative_area_level_3")
             ),
-            price_range=price_map.get(price_level) if price_level is not None else None,
-            photo_url=photo_url,
-        )
+            "price_range": price_map.get(price_level) if price_level is not None else None,
+            "photo_reference": photos[0]["photo_reference"] if photos else None,
+        }
+
+
+def photo_proxy_url(photo_reference: str) -> str:
+    """Public URL of a place photo served through our caching proxy."""
+    return f"{settings.api_public_url}/api/v1/places/photo/{photo_reference}"
+
+
+def _details_response(place_id: str, data: dict) -> PlaceDetailsResponse:
+    photo_ref = data["photo_reference"]
+    photo_url = photo_proxy_url(photo_ref) if photo_ref else None
+    fields = {key: value for key, value in data.items() if key != "photo_reference"}
+    return PlaceDetailsResponse(place_id=place_id, photo_url=photo_url, **fields)
@@ -1,56 +1,207 @@
 import uuid
+from datetime import datetime
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from src.core.pagination import encode_cursor, decode_cursor
 from src.repositories.restaurant import RestaurantRepository
-from src.schemas.restaurant import RestaurantCreate, RestaurantUpdate, RestaurantFilters
-from src.models.restaurant import Restaurant
+from src.repositories.tag import TagRepository
+from src.repositories.user_stat import RestaurantSummary, UserStatRepository, stats_delta
+from src.schemas.restaurant import (
+    RestaurantCreate,
+    RestaurantUpdate,
+    RestaurantFilters,
+    BulkItemResult,
+    BatchAddTags,
+    BatchOperation,
+    BatchOperationResult,
+    BatchPatch,
+    BatchRemoveTags,
+    BatchSetFavorite,
+    BatchSetStatus,
+)
+from src.models.restaurant import Restaurant, RestaurantStatus
+
+
+# Restaurants per export chunk, each read in a transaction of its own
+EXPORT_BATCH_SIZE = 500
+
+
+def _batch_tag_ids(operation: BatchOperation) -> list[uuid.UUID]:
+    if isinstance(operation, (BatchAddTags, BatchRemoveTags)):
+        return operation.tag_ids
+    if isinstance(operation, BatchPatch) and operation.fields.tag_ids:
+        return operation.fields.tag_ids
+    return []
 
 class RestaurantService:
     def __init__(self, db: Session):
         self.repo = RestaurantRepository(db)
+        self.tag_repo = TagRepository(db)
+        self.stats_repo = UserStatRepository(db)
 
     def create(self, user_id: uuid.UUID, data: RestaurantCreate) -> tuple[Restaurant, list]:
         tag_ids = data.tag_ids
         restaurant_data = data.model_dump(exclude={"tag_ids"})
         restaurant = self.repo.create(user_id=user_id, data=restaurant_data)
         if tag_ids:
-            self.repo.set_tags(restaurant, tag_ids)
-        tags = self.repo.get_tags(restaurant.id)
-        return restaurant, tags
+            self.repo.add_tags(restaurant, tag_ids)
+        self.stats_repo.apply(user_id, stats_delta([(None, RestaurantSummary.of(restaurant))]))
+        return self.repo.with_tags([restaurant])[0]
+
+    def bulk_create(self, user_id: uuid.UUID, items: list[RestaurantCreate]) -> list[BulkItemResult]:
+        """Create many restaurants at once, skipping items that reference unknown tags."""
+        known_tags = self.tag_repo.get_existing_ids({t for item in items for t in item.tag_ids})
+        results: list[BulkItemResult] = []
+        rows, row_tags, row_results = [], [], []
+        for index, item in enumerate(items):
+            result = BulkItemResult(index=index)
+            results.append(result)
+            unknown = [str(t) for t in item.tag_ids if t not in known_tags]
+            if unknown:
+                result.error = f"Unknown tag IDs: {', '.join(unknown)}"
+                continue
+            rows.append(item.model_dump(exclude={"tag_ids"}))
+            row_tags.append(list(dict.fromkeys(item.tag_ids)))
+            row_results.append(result)
+
+        if rows:
+            ids = self.repo.bulk_create(user_id=user_id, rows=rows, tag_ids=row_tags)
+            for result, restaurant_id in zip(row_results, ids):
+                result.id = restaurant_id
+            self.stats_repo.apply(user_id, stats_delta(
+                (None, RestaurantSummary(RestaurantStatus.SAVED, row["country"], row["city"], row["price_range"]))
+                for row in rows
+            ))
+        return results
+
+    def batch(self, user_id: uuid.UUID, operations: list[BatchOperation]) -> list[BatchOperationResult]:
+        """Apply typed operations to many restaurants, one set-based statement each.
+
+        IDs the user does not own are reported as not found. An operation
+        that references unknown tags is skipped with an error.
+        """
+        owned = self.repo.get_owned_ids(user_id, {rid for operation in operations for rid in operation.ids})
+        known_tags = self.tag_repo.get_existing_ids(
+            {t for operation in operations for t in _batch_tag_ids(operation)}
+        )
+        results: list[BatchOperationResult] = []
+        changes: list[tuple[RestaurantSummary, RestaurantSummary]] = []
+        for index, operation in enumerate(operations):
+            ids = list(dict.fromkeys(operation.ids))
+            result = BatchOperationResult(
+                index=index, op=operation.op, not_found=[rid for rid in ids if rid not in owned]
+            )
+            results.append(result)
+            unknown = [str(t) for t in _batch_tag_ids(operation) if t not in known_tags]
+            if unknown:
+                result.error = f"Unknown tag IDs: {', '.join(unknown)}"
+                continue
+            ids = [rid for rid in ids if rid in owned]
+            if ids:
+                changes.extend(self._apply(user_id, ids, operation))
+            result.updated = len(ids)
+        self.stats_repo.apply(user_id, stats_delta(changes))
+        return results
 
-    def get_all(self, user_id: uuid.UUID, filters: RestaurantFilters) -> list[tuple[Restaurant, list]]:
-        restaurants = self.repo.get_all(user_id=user_id, filters=filters)
-        return [(r, self.repo.get_tags(r.id)) for r in restaurants]
+    def _apply(
+        self, user_id: uuid.UUID, ids: list[uuid.UUID], operation: BatchOperation
+    ) -> list[tuple[RestaurantSummary, RestaurantSummary]]:
+        """Run one operation and return the stats summaries it changed."""
+        changes = []
+        if isinstance(operation, BatchSetFavorite):
+            changes = self.repo.update_many(user_id, ids, {"is_favorite": operation.is_favorite})
+        elif isinstance(operation, BatchSetStatus):
+            changes = self.repo.update_many(user_id, ids, {"status": RestaurantStatus(operation.status)})
+        elif isinstance(operation, BatchAddTags):
+            self.repo.add_tags_many(ids, list(dict.fromkeys(operation.tag_ids)))
+        elif isinstance(operation, BatchRemoveTags):
+            self.repo.remove_tags_many(ids, operation.tag_ids)
+        elif isinstance(operation, BatchPatch):
+            values = operation.fields.model_dump(exclude_unset=True, exclude={"tag_ids"})
+            if values:
+                changes = self.repo.update_many(user_id, ids, values)
+            if operation.fields.tag_ids is not None:
+                self.repo.remove_tags_many(ids)
+                if operation.fields.tag_ids:
+                    self.repo.add_tags_many(ids, list(dict.fromkeys(operation.fields.tag_ids)))
+        return changes
+
+    def get_all(
+        self,
+        user_id: uuid.UUID,
+        filters: RestaurantFilters,
+        limit: int,
+        cursor: str | None = None,
+    ) -> tuple[list[tuple[Restaurant, list]], str | None]:
+        after = None
+        if cursor:
+            parsers = [datetime.fromisoformat, uuid.UUID]
+            if filters.q:
+                parsers.insert(0, float)
+            try:
+                after = decode_cursor(cursor, *parsers)
+            except ValueError:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+        # Fetch one extra row to learn whether another page exists
+        rows = self.repo.get_all(user_id=user_id, filters=filters, limit=limit + 1, after=after)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(*rows[-1][1])
+        restaurants = [restaurant for restaurant, _ in rows]
+        return self.repo.with_tags(restaurants), next_cursor
+
+    def export_batch(
+        self, user_id: uuid.UUID, after: tuple | None, limit: int = EXPORT_BATCH_SIZE
+    ) -> tuple[list[tuple[Restaurant, list]], tuple | None]:
+        """Return the next export batch after ``after`` and the position to
+        continue from, or None once the collection is exhausted."""
+        # One extra row tells whether another batch follows
+        rows = self.repo.get_all(user_id=user_id, filters=RestaurantFilters(), limit=limit + 1, after=after)
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_after = rows[-1][1]
+        return self.repo.with_tags([restaurant for restaurant, _ in rows]), next_after
 
     def get_by_id(self, restaurant_id: uuid.UUID, user_id: uuid.UUID) -> tuple[Restaurant, list]:
         restaurant = self.repo.get_by_id(restaurant_id, user_id)
         if not restaurant:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Restaurant not found")
-        tags = self.repo.get_tags(restaurant.id)
-        return restaurant, tags
+        return self.repo.with_tags([restaurant])[0]
 
     def update(self, restaurant_id: uuid.UUID, user_id: uuid.UUID, data: RestaurantUpdate) -> tuple[Restaurant, list]:
-        restaurant = self.repo.get_by_id(restaurant_id, user_id)
+        restaurant = self.repo.get_by_id_for_update(restaurant_id, user_id)
         if not restaurant:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Restaurant not found")
         update_data = data.model_dump(exclude_unset=True, exclude={"tag_ids"})
         if update_data:
+            before = RestaurantSummary.of(restaurant)
             restaurant = self.repo.update(restaurant, update_data)
+            self.stats_repo.apply(user_id, stats_delta([(before, RestaurantSummary.of(restaurant))]))
         if data.tag_ids is not None:
             self.repo.set_tags(restaurant, data.tag_ids)
-        tags = self.repo.get_tags(restaurant.id)
-        return restaurant, tags
+        return self.repo.with_tags([restaurant])[0]
 
     def delete(self, restaurant_id: uuid.UUID, user_id: uuid.UUID) -> None:
-        restaurant = self.repo.get_by_id(restaurant_id, user_id)
-        if not restaurant:
+        deleted = self.repo.delete_many(user_id, [restaurant_id])
+        if not deleted:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Restaurant not found")
-        self.repo.delete(restaurant)
+        self.stats_repo.apply(user_id, stats_delta((summary, None) for _, summary in deleted))
+
+    def bulk_delete(self, user_id: uuid.UUID, restaurant_ids: list[uuid.UUID]) -> tuple[int, list[uuid.UUID]]:
+        """Delete many restaurants; returns how many went and which IDs were not found."""
+        restaurant_ids = list(dict.fromkeys(restaurant_ids))
+        deleted = dict(self.repo.delete_many(user_id, restaurant_ids))
+        self.stats_repo.apply(user_id, stats_delta((summary, None) for summary in deleted.values()))
+        return len(deleted), [rid for rid in restaurant_ids if rid not in deleted]
 
     def toggle_favorite(self, restaurant_id: uuid.UUID, user_id: uuid.UUID) -> tuple[Restaurant, list]:
-        restaurant = self.repo.get_by_id(restaurant_id, user_id)
+        restaurant = self.repo.get_by_id_for_update(restaurant_id, user_id)
         if not restaurant:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Restaurant not found")
+        before = RestaurantSummary.of(restaurant)
         restaurant = self.repo.update(restaurant, {"is_favorite": not restaurant.is_favorite})
-        tags = self.repo.get_tags(restaurant.id)
-        return restaurant, tags
\ No newline at end of file
+        self.stats_repo.apply(user_id, stats_delta([(before, RestaurantSummary.of(restaurant))]))
+        return self.repo.with_tags([restaurant])[0]
\ No newline at end of file
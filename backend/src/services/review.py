@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from src.repositories.restaurant import RestaurantRepository
 from src.repositories.review import ReviewRepository
+from src.repositories.user_stat import RestaurantSummary, UserStatRepository, stats_delta
 from src.schemas.review import ReviewCreate
 from src.models.restaurant import Restaurant, RestaurantStatus
 from src.models.review import Review
@@ -12,28 +13,37 @@ class ReviewService:
     def __init__(self, db: Session):
         self.restaurant_repo = RestaurantRepository(db)
         self.review_repo = ReviewRepository(db)
+        self.stats_repo = UserStatRepository(db)
 
     def mark_tried(self, restaurant_id: uuid.UUID, user_id: uuid.UUID, data: ReviewCreate) -> tuple[Restaurant, Review]:
-        restaurant = self.restaurant_repo.get_by_id(restaurant_id, user_id)
+        restaurant = self.restaurant_repo.get_by_id_for_update(restaurant_id, user_id)
         if not restaurant:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Restaurant not found")
+        # The review joined to the locked row may predate a concurrent
+        # mark-tried we waited for; read it again now that we hold the lock
+        existing = self.review_repo.get_by_restaurant_id(restaurant_id)
+        before = RestaurantSummary.of(restaurant)._replace(rating=existing.rating if existing else None)
 
         # Update status to tried
         restaurant = self.restaurant_repo.update(restaurant, {"status": RestaurantStatus.TRIED})
 
         # Create or update review
-        existing = self.review_repo.get_by_restaurant_id(restaurant_id)
         if existing:
             review = self.review_repo.update(existing, data.rating, data.review_text, data.visited_at)
         else:
             review = self.review_repo.create(restaurant_id, data.rating, data.review_text, data.visited_at)
 
+        after = before._replace(status=RestaurantStatus.TRIED, rating=data.rating)
+        self.stats_repo.apply(user_id, stats_delta([(before, after)]))
         return restaurant, review
 
     def mark_saved(self, restaurant_id: uuid.UUID, user_id: uuid.UUID) -> Restaurant:
-        restaurant = self.restaurant_repo.get_by_id(restaurant_id, user_id)
+        restaurant = self.restaurant_repo.get_by_id_for_update(restaurant_id, user_id)
         if not restaurant:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Restaurant not found")
 
+        before = RestaurantSummary.of(restaurant)
         restaurant = self.restaurant_repo.update(restaurant, {"status": RestaurantStatus.SAVED})
+        after = before._replace(status=RestaurantStatus.SAVED)
+        self.stats_repo.apply(user_id, stats_delta([(before, after)]))
         return restaurant
\ No newline at end of file
@@ -0,0 +1,56 @@
+import sys
+import uuid
+from collections import defaultdict
+from sqlalchemy.orm import Session
+from src.core.database import SessionLocal
+from src.models.restaurant import RestaurantStatus
+from src.repositories.user_stat import UserStatRepository
+from src.schemas.stats import StatsResponse
+
+RATINGS = range(1, 6)
+
+
+def _by_count(counts: dict[str, int]) -> dict[str, int]:
+    return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+
+class StatsService:
+    def __init__(self, db: Session):
+        self.repo = UserStatRepository(db)
+
+    def get(self, user_id: uuid.UUID) -> StatsResponse:
+        """Summarize the user's collection from its maintained counters.
+
+        Reads one row per distinct counter (status, country, city, ...), so
+        the cost does not grow with the number of restaurants.
+        """
+        counts: dict[str, dict[str, int]] = defaultdict(dict)
+        for stat in self.repo.get(user_id):
+            counts[stat.metric][stat.key] = stat.count
+        ratings = {rating: counts["rating"].get(str(rating), 0) for rating in RATINGS}
+        reviewed = sum(ratings.values())
+        return StatsResponse(
+            total=counts["total"].get("", 0),
+            favorites=counts["favorite"].get("", 0),
+            by_status={s.value: counts["status"].get(s.value, 0) for s in RestaurantStatus},
+            by_country=_by_count(counts["country"]),
+            by_city=_by_count(counts["city"]),
+            by_price_range=dict(sorted((int(k), v) for k, v in counts["price_range"].items())),
+            rating_histogram=ratings,
+            reviewed=reviewed,
+            average_rating=(
+                round(sum(rating * n for rating, n in ratings.items()) / reviewed, 2) if reviewed else None
+            ),
+        )
+
+
+def rebuild_stats(user_ids: list[uuid.UUID] | None = None) -> None:
+    """Recompute stats from the restaurants, for drift after manual data fixes."""
+    with SessionLocal() as db:
+        UserStatRepository(db).rebuild(user_ids)
+        db.commit()
+
+
+if __name__ == "__main__":
+    # python -m src.services.stats [user_id ...]; no IDs rebuilds every user
+    rebuild_stats([uuid.UUID(arg) for arg in sys.argv[1:]] or None)
@@ -1,14 +1,35 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from src.core.cache import CachedJSON, TTLCache
+from src.core.config import settings
+from src.core.database import after_commit
 from src.repositories.tag import TagRepository
-from src.schemas.tag import TagCreate
+from src.schemas.tag import ConfigOptions, TagCreate, TagResponse
 from src.models.tag import Tag
 
+# (payload name, catalog version) -> serialized response body
+catalog_cache: TTLCache[tuple[str, int], CachedJSON] = TTLCache(
+    "tags", 16, settings.tag_cache_ttl_seconds
+)
+
 
 class TagService:
+    # Bumped whenever this process changes the catalog, which orphans
+    # every cached payload built from the previous version
+    catalog_version = 0
+
     def __init__(self, db: Session):
+        self.db = db
         self.repo = TagRepository(db)
 
+    @classmethod
+    def bump_catalog_version(cls) -> None:
+        cls.catalog_version += 1
+
+    @classmethod
+    def get_cached(cls, name: str) -> CachedJSON | None:
+        return catalog_cache.get((name, cls.catalog_version))
+
     def create(self, data: TagCreate) -> Tag:
         existing = self.repo.get_by_name(data.name)
         if existing:
@@ -16,10 +37,25 @@ class TagService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Tag '{data.name}' already exists",
             )
-        return self.repo.create(name=data.name, category=data.category)
+        tag = self.repo.create(name=data.name, category=data.category)
+        after_commit(self.db, self.bump_catalog_version)
+        return tag
 
     def get_all(self) -> list[Tag]:
         return self.repo.get_all()
 
     def get_config_options(self) -> dict[str, list[Tag]]:
-        return self.repo.get_grouped_by_category()
\ No newline at end of file
+        return self.repo.get_grouped_by_category()
+
+    def get_all_json(self) -> CachedJSON:
+        # Read the version first so a concurrent create is never masked
+        version = self.catalog_version
+        payload = CachedJSON.dump(list[TagResponse], self.get_all())
+        catalog_cache.set(("tags", version), payload)
+        return payload
+
+    def get_config_options_json(self) -> CachedJSON:
+        version = self.catalog_version
+        payload = CachedJSON.dump(ConfigOptions, {"options": self.get_config_options()})
+        catalog_cache.set(("config_options", version), payload)
+        return payload
@@ -0,0 +1,48 @@
+"""Fixtures for the database tests.
+
+App modules are imported inside the fixtures: test modules skip through
+``tests.database.require_database()`` before anything needs the settings.
+"""
+import pytest
+
+
+@pytest.fixture(scope="module")
+def tag_ids():
+    from benchmarks.common import seed_tags
+
+    return seed_tags(5)
+
+
+@pytest.fixture(scope="module")
+def user():
+    """A throwaway user, ``(user_id, api_key)``, deleted after the module."""
+    from benchmarks.common import seeded_user
+
+    with seeded_user() as found:
+        yield found
+
+
+@pytest.fixture(scope="module")
+def client(user):
+    """An authenticated client for ``user`` whose API key is already cached."""
+    from benchmarks.common import api_client
+    from src.core.config import settings
+
+    # Nothing under test queues email; keep the sender's polling out of the counts
+    sender_enabled = settings.email_outbox_sender_enabled
+    settings.email_outbox_sender_enabled = False
+    try:
+        with api_client(user[1]) as client:
+            client.get("/api/v1/auth/me").raise_for_status()
+            yield client
+    finally:
+        settings.email_outbox_sender_enabled = sender_enabled
+
+
+@pytest.fixture
+def statements():
+    """Counts statements (``before_cursor_execute``) and commits on the request
+    engine while used as a context manager; each ``with`` starts from zero."""
+    from benchmarks.common import StatementCounter
+
+    return StatementCounter()
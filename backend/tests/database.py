@@ -0,0 +1,39 @@
+"""Decide whether the database tests can run here.
+
+They need the app's settings, including DATABASE_URL, pointing at a
+disposable Postgres migrated to head, the same setup as the benchmarks.
+Modules that need it call ``require_database()`` before importing the app.
+"""
+import functools
+from pathlib import Path
+
+import pytest
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+ALEMBIC_INI = Path(__file__).resolve().parents[1] / "alembic.ini"
+
+
+@functools.cache
+def unavailable_reason() -> str | None:
+    """Why the database tests cannot run, or None when they can."""
+    try:
+        from src.core.database import engine
+    except Exception as exc:
+        return f"app settings are incomplete (is DATABASE_URL set?): {exc}"
+    head = ScriptDirectory.from_config(Config(str(ALEMBIC_INI))).get_current_head()
+    try:
+        with engine.connect() as connection:
+            current = connection.exec_driver_sql("SELECT version_num FROM alembic_version").scalar()
+    except Exception as exc:
+        return f"database is unreachable or not migrated: {exc}"
+    if current != head:
+        return f"database is at revision {current}, not head {head}"
+    return None
+
+
+def require_database() -> None:
+    """Skip the calling test module unless the database is ready."""
+    reason = unavailable_reason()
+    if reason is not None:
+        pytest.skip(reason, allow_module_level=True)
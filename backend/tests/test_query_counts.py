@@ -0,0 +1,43 @@
+"""Reading restaurants costs a constant number of statements.
+
+Tags are batch-loaded for the whole result set, so neither the number of
+rows nor the number of tags on a row may add statements.
+"""
+from tests.database import require_database
+
+require_database()
+
+from benchmarks.common import seed_restaurants  # noqa: E402
+
+SIZES = (1, 10, 100, 500)
+
+
+def test_list_statements_do_not_grow_with_rows(client, user, tag_ids, statements):
+    user_id, _ = user
+    counts: dict[int, int] = {}
+    seeded = 0
+    for size in SIZES:
+        seed_restaurants(user_id, size - seeded, tag_ids)
+        seeded = size
+        with statements:
+            response = client.get("/api/v1/restaurants", params={"limit": 200})
+        response.raise_for_status()
+        counts[size] = statements.count
+    assert len(set(counts.values())) == 1, f"statements per list grow with rows: {counts}"
+
+
+def test_detail_statements_do_not_grow_with_tags(client, user, tag_ids, statements):
+    user_id, _ = user
+    seed_restaurants(user_id, len(tag_ids) + 1, tag_ids)
+    items = client.get("/api/v1/restaurants", params={"limit": 200}).json()["items"]
+    fewest = min(items, key=lambda item: len(item["tags"]))
+    most = max(items, key=lambda item: len(item["tags"]))
+    assert len(most["tags"]) > len(fewest["tags"])
+
+    counts = []
+    for item in (fewest, most):
+        with statements:
+            response = client.get(f"/api/v1/restaurants/{item['id']}")
+        response.raise_for_status()
+        counts.append(statements.count)
+    assert counts[0] == counts[1], f"statements per detail grow with tags: {counts}"
@@ -0,0 +1,105 @@
+"""Every restaurant list filter combination is served from indexes.
+
+Seeds a large collection with ``benchmarks.seed``, then calls
+``RestaurantRepository.get_all`` with every combination of the list
+filters (status, country, city, price range, tags, favorite and search),
+for the first page and for the page after it, and EXPLAINs the statement
+it sends. The plan must reach ``restaurants`` through one of its indexes
+led by ``user_id`` and never sequentially scan it.
+"""
+import itertools
+
+import pytest
+
+from tests.database import require_database
+
+require_database()
+
+from sqlalchemy import event  # noqa: E402
+
+from benchmarks.common import seed_tags  # noqa: E402
+from benchmarks.seed import seed, unseed  # noqa: E402
+from src.core.database import SessionLocal, engine  # noqa: E402
+from src.repositories.restaurant import RestaurantRepository  # noqa: E402
+from src.schemas.restaurant import RestaurantFilters  # noqa: E402
+
+# Large enough that the planner prefers indexes the way it would in production
+USERS = 20
+RESTAURANTS = 5000
+TAGS = 20
+PAGE_SIZE = 50
+# Values for each filter; None leaves the filter out, "tags" means two tag IDs
+FILTERS = {
+    "status": [None, "tried"],
+    "country": [None, "ita"],
+    "city": [None, "tok"],
+    "price_range": [None, 2],
+    "tag_ids": [None, "tags"],
+    "is_favorite": [None, True, False],
+    "q": [None, "ramen"],
+}
+COMBINATIONS = [dict(zip(FILTERS, values)) for values in itertools.product(*FILTERS.values())]
+
+
+def label(fields: dict) -> str:
+    return " ".join(f"{name}={value}" for name, value in fields.items() if value is not None) or "no filters"
+
+
+def plan_nodes(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    """``(db, user_id, tag_ids, user_id_indexes)`` over the seeded collection."""
+    users = seed(USERS, RESTAURANTS, TAGS, seed=1)
+    try:
+        with SessionLocal() as db:
+            # Indexes on restaurants whose first column is user_id
+            indexes = set(db.connection().exec_driver_sql(
+                "SELECT c.relname FROM pg_index i"
+                " JOIN pg_class c ON c.oid = i.indexrelid"
+                " JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0]"
+                " WHERE i.indrelid = 'restaurants'::regclass AND a.attname = 'user_id'"
+            ).scalars())
+            yield db, users[0].id, seed_tags(TAGS), indexes
+    finally:
+        unseed(users)
+
+
+def explain(db, user_id, filters: RestaurantFilters, after: tuple | None) -> tuple[dict, list]:
+    """Run get_all and return the JSON plan of its statement and the rows."""
+    sent = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        sent.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        rows = RestaurantRepository(db).get_all(user_id, filters, PAGE_SIZE + 1, after)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    (statement, parameters), = sent
+    result = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    return result.scalar_one()[0]["Plan"], rows
+
+
+@pytest.mark.parametrize("fields", COMBINATIONS, ids=label)
+def test_list_filters_use_indexes(dataset, fields):
+    db, user_id, tag_ids, user_id_indexes = dataset
+    filters = RestaurantFilters(**{**fields, "tag_ids": tag_ids[:2] if fields["tag_ids"] else None})
+    after = None
+    for page in (1, 2):
+        plan, rows = explain(db, user_id, filters, after)
+        nodes = list(plan_nodes(plan))
+        assert not any(
+            node["Node Type"] == "Seq Scan" and node["Relation Name"] == "restaurants" for node in nodes
+        ), f"page {page}: sequential scan on restaurants"
+        used = {node["Index Name"] for node in nodes if "Index Name" in node}
+        assert used & user_id_indexes, f"page {page}: restaurants not read by user_id index, used {sorted(used)}"
+        # The second page starts after the last row of the first
+        if len(rows) <= PAGE_SIZE:
+            break
+        after = rows[PAGE_SIZE - 1][1]
@@ -0,0 +1,110 @@
+"""Every write request commits once and issues a known number of statements.
+
+Bulk endpoints are measured with ``BULK`` rows; their counts must not
+grow with it.
+"""
+import secrets
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tests.database import require_database
+
+require_database()
+
+from src.core.database import SessionLocal  # noqa: E402
+from src.models.password_reset_token import PasswordResetToken  # noqa: E402
+
+RESTAURANT = {"name": "Write Counts", "country": "Japan", "city": "Tokyo"}
+BULK = 200
+# Statements each request issues today. Lower one when an endpoint gets
+# cheaper; raising one needs a reason, as a regression would.
+EXPECTED = {
+    "POST /restaurants": 4,
+    "PATCH /restaurants/{id}": 5,
+    "POST /restaurants/{id}/toggle-favorite": 4,
+    "POST /restaurants/{id}/mark-tried": 6,
+    "POST /restaurants/{id}/mark-saved": 4,
+    "DELETE /restaurants/{id}": 2,
+    "POST /restaurants/bulk": 4,
+    "POST /restaurants/batch": 6,
+    "POST /restaurants/bulk-delete": 2,
+    "POST /auth/reset-password": 3,
+}
+
+
+def create_reset_token(user_id) -> str:
+    token = secrets.token_urlsafe(32)
+    with SessionLocal() as db:
+        db.add(PasswordResetToken(
+            user_id=user_id, token=token, expires_at=datetime.now(timezone.utc) + timedelta(hours=1)
+        ))
+        db.commit()
+    return token
+
+
+@pytest.fixture(scope="module")
+def counts(client, user, tag_ids) -> dict[str, tuple[int, int]]:
+    """Run each write endpoint once, in order, and return its
+    ``(statements, commits)``. Bulk endpoints get ``BULK`` rows."""
+    from benchmarks.common import StatementCounter
+
+    user_id, _ = user
+    tag_ids = [str(t) for t in tag_ids]
+    token = create_reset_token(user_id)
+    counter = StatementCounter()
+    found: dict[str, tuple[int, int]] = {}
+
+    def measure(label: str, method: str, url: str, **kwargs):
+        with counter:
+            response = client.request(method, url, **kwargs)
+        response.raise_for_status()
+        found[label] = counter.count, counter.commits
+        return response
+
+    created = measure(
+        "POST /restaurants", "POST", "/api/v1/restaurants",
+        json={**RESTAURANT, "tag_ids": tag_ids[:2]},
+    ).json()
+    path = f"/api/v1/restaurants/{created['id']}"
+    measure("PATCH /restaurants/{id}", "PATCH", path, json={"notes": "counted", "tag_ids": tag_ids[1:]})
+    measure("POST /restaurants/{id}/toggle-favorite", "POST", f"{path}/toggle-favorite")
+    measure(
+        "POST /restaurants/{id}/mark-tried", "POST", f"{path}/mark-tried",
+        json={"rating": 4, "review_text": "Good"},
+    )
+    measure("POST /restaurants/{id}/mark-saved", "POST", f"{path}/mark-saved")
+    measure("DELETE /restaurants/{id}", "DELETE", path)
+    bulk = measure(
+        "POST /restaurants/bulk", "POST", "/api/v1/restaurants/bulk",
+        json={"items": [{**RESTAURANT, "tag_ids": tag_ids}] * BULK},
+    ).json()
+    bulk_ids = [result["id"] for result in bulk["results"]]
+    measure(
+        "POST /restaurants/batch", "POST", "/api/v1/restaurants/batch",
+        json={"operations": [
+            {"op": "set_favorite", "ids": bulk_ids, "is_favorite": True},
+            {"op": "set_status", "ids": bulk_ids, "status": "saved"},
+            {"op": "remove_tags", "ids": bulk_ids, "tag_ids": tag_ids[:1]},
+        ]},
+    )
+    measure("POST /restaurants/bulk-delete", "POST", "/api/v1/restaurants/bulk-delete", json={"ids": bulk_ids})
+    measure(
+        "POST /auth/reset-password", "POST", "/api/v1/auth/reset-password",
+        json={"token": token, "new_password": secrets.token_urlsafe(12)},
+    )
+    return found
+
+
+@pytest.mark.parametrize("endpoint", EXPECTED)
+def test_commits_once(counts, endpoint):
+    _, commits = counts[endpoint]
+    assert commits == 1, f"{endpoint} committed {commits} times"
+
+
+@pytest.mark.parametrize("endpoint", EXPECTED)
+def test_statement_count(counts, endpoint):
+    statements, _ = counts[endpoint]
+    assert statements <= EXPECTED[endpoint], (
+        f"{endpoint} issued {statements} statements, expected {EXPECTED[endpoint]}"
+    )
@@ -47,6 +47,11 @@ export interface RestaurantFilters {
   is_favorite?: boolean
 }
 
+export interface RestaurantPage {
+  items: Restaurant[]
+  next_cursor: string | null
+}
+
 export interface CreateRestaurantData {
   name: string
   country: string
@@ -67,8 +72,14 @@ export interface MarkTriedData {
   visited_at?: string
 }
 
+const PAGE_SIZE = 50
+
 export const restaurantsApi = {
-  list: async (filters: RestaurantFilters = {}): Promise<Restaurant[]> => {
+  listPage: async (
+    filters: RestaurantFilters = {},
+    cursor?: string | null,
+    limit: number = PAGE_SIZE
+  ): Promise<RestaurantPage> => {
     const { tag_ids, ...rest } = filters
     const params = new URLSearchParams()
     Object.entries(rest).forEach(([k, v]) => {
@@ -77,6 +88,8 @@ export const restaurantsApi = {
     if (tag_ids && tag_ids.length > 0) {
       tag_ids.forEach((id) => params.append('tag_ids', id))
     }
+    params.append('limit', String(limit))
+    if (cursor) params.append('cursor', cursor)
     const res = await client.get(`/restaurants?${params.toString()}`)
     return res.data
   },
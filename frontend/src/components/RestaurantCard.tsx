@@ -1,6 +1,6 @@
 import { MapPin, ExternalLink, Star, Globe } from 'lucide-react'
 import type { Restaurant } from '../api/restaurants'
-import { priceRangeLabel, starsArray, formatDate } from '../utils/helpers'
+import { priceRangeLabel, starsArray, formatDate, photoVariant } from '../utils/helpers'
 
 interface RestaurantCardProps {
   restaurant: Restaurant
@@ -17,7 +17,7 @@ export default function RestaurantCard({ restaurant, onClick, onToggleFavorite }
       className="bg-white rounded-2xl border border-[#E8E2DA]/60 shadow-sm flex overflow-hidden cursor-pointer hover:shadow-md hover:-translate-y-0.5 transition-all"
     >
       {photo_url ? (
-        <img src={photo_url} alt={name} className="w-24 flex-shrink-0 object-cover" />
+        <img src={photoVariant(photo_url, 200)} alt={name} className="w-24 flex-shrink-0 object-cover" />
       ) : (
         <div className="w-24 flex-shrink-0 bg-gradient-to-br from-cream-dark to-terracotta-pale flex items-center justify-center text-3xl">
           🍽️
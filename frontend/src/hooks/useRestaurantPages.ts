@@ -0,0 +1,83 @@
+import { useCallback, useEffect, useRef, useState } from 'react'
+import { restaurantsApi } from '../api/restaurants'
+import type { Restaurant, RestaurantFilters } from '../api/restaurants'
+
+// Loads the restaurant list one page at a time: load() fetches the first
+// page for a set of filters, and the next page is fetched when the element
+// given sentinelRef scrolls into view
+export function useRestaurantPages() {
+  const [restaurants, setRestaurants] = useState<Restaurant[]>([])
+  const [hasMore, setHasMore] = useState(false)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const filters = useRef<RestaurantFilters>({})
+  const cursor = useRef<string | null>(null)
+  const fetching = useRef(false)
+  // Bumped on every load() so pages of a previous filter set are dropped
+  const generation = useRef(0)
+  const observer = useRef<IntersectionObserver | null>(null)
+  const sentinel = useRef<HTMLElement | null>(null)
+
+  const load = useCallback(async (next: RestaurantFilters) => {
+    const current = ++generation.current
+    filters.current = next
+    cursor.current = null
+    fetching.current = true
+    try {
+      const page = await restaurantsApi.listPage(next)
+      if (current !== generation.current) return
+      setRestaurants(page.items)
+      cursor.current = page.next_cursor
+      setHasMore(page.next_cursor !== null)
+    } catch (err) {
+      console.error(err)
+    } finally {
+      if (current === generation.current) fetching.current = false
+    }
+  }, [])
+
+  const loadMore = useCallback(async () => {
+    if (fetching.current || !cursor.current) return
+    const current = generation.current
+    fetching.current = true
+    setLoadingMore(true)
+    try {
+      const page = await restaurantsApi.listPage(filters.current, cursor.current)
+      if (current !== generation.current) return
+      setRestaurants((prev) => [...prev, ...page.items])
+      cursor.current = page.next_cursor
+      setHasMore(page.next_cursor !== null)
+    } catch (err) {
+      console.error(err)
+    } finally {
+      if (current === generation.current) fetching.current = false
+      setLoadingMore(false)
+    }
+  }, [])
+
+  const sentinelRef = useCallback(
+    (node: HTMLElement | null) => {
+      observer.current?.disconnect()
+      observer.current = null
+      sentinel.current = node
+      if (!node) return
+      observer.current = new IntersectionObserver(
+        (entries) => {
+          if (entries.some((entry) => entry.isIntersecting)) loadMore()
+        },
+        { rootMargin: '400px' }
+      )
+      observer.current.observe(node)
+    },
+    [loadMore]
+  )
+
+  // Observing again reports the sentinel's current visibility, so a page too
+  // short to fill the screen is followed by the next one
+  useEffect(() => {
+    if (!observer.current || !sentinel.current) return
+    observer.current.unobserve(sentinel.current)
+    observer.current.observe(sentinel.current)
+  }, [restaurants])
+
+  return { restaurants, setRestaurants, hasMore, loadingMore, load, sentinelRef }
+}
@@ -5,26 +5,21 @@ import RestaurantCard from '../components/RestaurantCard'
 import FilterBar from '../components/FilterBar'
 import RestaurantModal from '../components/RestaurantModal'
 import AddRestaurantModal from '../components/AddRestaurantModal'
-import { restaurantsApi } from '../api/restaurants'
 import { tagsApi } from '../api/tags'
+import { useRestaurantPages } from '../hooks/useRestaurantPages'
 import type { Restaurant, RestaurantFilters } from '../api/restaurants'
 import type { Tag } from '../api/restaurants'
 
 export default function SavedPage() {
-  const [restaurants, setRestaurants] = useState<Restaurant[]>([])
+  const { restaurants, setRestaurants, hasMore, loadingMore, load, sentinelRef } =
+    useRestaurantPages()
   const [tags, setTags] = useState<Tag[]>([])
   const [loading, setLoading] = useState(true)
   const [showAdd, setShowAdd] = useState(false)
   const [selected, setSelected] = useState<Restaurant | null>(null)
 
-  const fetchRestaurants = async (filters: RestaurantFilters = {}) => {
-    try {
-      const data = await restaurantsApi.list({ ...filters, status: 'saved' })
-      setRestaurants(data)
-    } catch (err) {
-      console.error(err)
-    }
-  }
+  const fetchRestaurants = (filters: RestaurantFilters = {}) =>
+    load({ ...filters, status: 'saved' })
 
   useEffect(() => {
     const init = async () => {
@@ -64,7 +59,8 @@ export default function SavedPage() {
             Want to try
           </h1>
           <p className='text-sm text-brown-light mt-0.5'>
-            {restaurants.length} places saved
+            {restaurants.length}
+            {hasMore ? '+' : ''} places saved
           </p>
         </div>
         <button
@@ -105,6 +101,13 @@ export default function SavedPage() {
               onClick={() => setSelected(r)}
             />
           ))}
+          {hasMore && (
+            <div ref={sentinelRef} className='flex justify-center py-4'>
+              {loadingMore && (
+                <div className='w-5 h-5 border-2 border-terracotta border-t-transparent rounded-full animate-spin' />
+              )}
+            </div>
+          )}
         </div>
       )}
 
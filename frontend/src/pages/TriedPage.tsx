@@ -6,23 +6,19 @@ import FilterBar from '../components/FilterBar'
 import RestaurantModal from '../components/RestaurantModal'
 import { restaurantsApi } from '../api/restaurants'
 import { tagsApi } from '../api/tags'
+import { useRestaurantPages } from '../hooks/useRestaurantPages'
 import type { Restaurant, RestaurantFilters } from '../api/restaurants'
 import type { Tag } from '../api/restaurants'
 
 export default function TriedPage() {
-  const [restaurants, setRestaurants] = useState<Restaurant[]>([])
+  const { restaurants, setRestaurants, hasMore, loadingMore, load, sentinelRef } =
+    useRestaurantPages()
   const [tags, setTags] = useState<Tag[]>([])
   const [loading, setLoading] = useState(true)
   const [selected, setSelected] = useState<Restaurant | null>(null)
 
-  const fetchRestaurants = async (filters: RestaurantFilters = {}) => {
-    try {
-      const data = await restaurantsApi.list({ ...filters, status: 'tried' })
-      setRestaurants(data)
-    } catch (err) {
-      console.error(err)
-    }
-  }
+  const fetchRestaurants = (filters: RestaurantFilters = {}) =>
+    load({ ...filters, status: 'tried' })
 
   useEffect(() => {
     const init = async () => {
@@ -73,7 +69,8 @@ export default function TriedPage() {
             Places I've tried
           </h1>
           <p className='text-sm text-brown-light mt-0.5'>
-            {restaurants.length} places visited
+            {restaurants.length}
+            {hasMore ? '+' : ''} places visited
           </p>
         </div>
       </div>
@@ -108,6 +105,13 @@ export default function TriedPage() {
               onToggleFavorite={() => handleToggleFavorite(r.id)}
             />
           ))}
+          {hasMore && (
+            <div ref={sentinelRef} className='flex justify-center py-4'>
+              {loadingMore && (
+                <div className='w-5 h-5 border-2 border-terracotta border-t-transparent rounded-full animate-spin' />
+              )}
+            </div>
+          )}
         </div>
       )}
 
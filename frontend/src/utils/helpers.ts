@@ -14,3 +14,11 @@ export const formatDate = (dateString: string): string => {
 export const starsArray = (rating: number): string => {
   return '★'.repeat(rating) + '☆'.repeat(5 - rating)
 }
+
+// Photos served by our places photo proxy come in several widths;
+// other URLs are returned unchanged
+export const photoVariant = (url: string, width: number): string => {
+  if (!url.includes('/api/v1/places/photo/')) return url
+  const [base] = url.split('?')
+  return `${base}?w=${width}`
+}